@@ -8,6 +8,9 @@ from app.core.db import db
 class BaseRepository:
     """기본 Repository 클래스"""
 
+    # 도메인별 싱글톤이 테이블 이름만 가지므로 인스턴스 __dict__ 없이 슬롯으로 보관
+    __slots__ = ("table_name",)
+
     def __init__(self, table_name: str):
         """
         BaseRepository 초기화
@@ -16,6 +16,11 @@ class Settings(BaseSettings):
     DB_NAME: str
     DB_USER: str
     DB_PASSWORD: str
+    # 커넥션 풀 설정 (환경 변수로 조정 가능)
+    DB_POOL_MIN_SIZE: int = 5
+    DB_POOL_MAX_SIZE: int = 20
+    DB_STATEMENT_CACHE_SIZE: int = 200
+    DB_MAX_INACTIVE_CONNECTION_LIFETIME: float = 300.0
 
     # 애플리케이션 설정
     APP_NAME: str
@@ -29,6 +34,9 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     REFRESH_TOKEN_EXPIRE_DAYS: int
 
+    # 비밀번호 해싱 설정 (bcrypt cost, 1 증가마다 해싱 시간 2배)
+    BCRYPT_ROUNDS: int = 12
+
     # CORS 설정
     ALLOWED_ORIGINS: str
 
@@ -42,5 +50,6 @@ class Settings(BaseSettings):
     SMTP_USERNAME: str
     SMTP_PASSWORD: str
     SMTP_FROM_EMAIL: str
+    SMTP_MAX_CONCURRENCY: int = 5  # 동시 발송 수 (메일 서버 속도 제한 대비)
 
 settings: Final[Settings] = Settings()
\ No newline at end of file
@@ -2,12 +2,33 @@ from typing import Optional, List, Awaitable
 from contextlib import asynccontextmanager
 
 import asyncpg
+from asyncpg.prepared_stmt import PreparedStatement
 
 from app.core.config import settings
 
+class PreparedConnection(asyncpg.Connection):
+    """등록된 쿼리를 커넥션 생성 시점에 미리 prepare 해 두는 커넥션"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 이름 -> PreparedStatement
+        self.prepared: dict[str, PreparedStatement] = {}
+
+
 class Database:
     def __init__(self):
         self.pool: Optional[asyncpg.Pool] = None
+        # 이름 -> SQL (풀 생성 전에 등록, 커넥션마다 미리 prepare)
+        self._statements: dict[str, str] = {}
+
+    def register_statement(self, name: str, query: str) -> None:
+        """자주 실행되는 고정 쿼리 등록 (connect() 전에 호출)"""
+        self._statements[name] = query
+
+    async def _prepare_statements(self, conn: PreparedConnection) -> None:
+        """새 커넥션마다 등록된 쿼리를 prepare (첫 요청에서 parse/plan 비용 제거)"""
+        for name, query in self._statements.items():
+            conn.prepared[name] = await conn.prepare(query)
 
     async def connect(self) -> None:
         """데이터베이스 연결 풀 생성"""
@@ -17,9 +38,16 @@ class Database:
             database=settings.DB_NAME,
             user=settings.DB_USER,
             password=settings.DB_PASSWORD,
-            min_size=5,
-            max_size=20,
-            timeout=30
+            # 미리 열어 둔 커넥션으로 순간 몰리는 조회 요청을 받고, 최대치는 DB 쪽 부하 기준으로 제한
+            min_size=settings.DB_POOL_MIN_SIZE,
+            max_size=settings.DB_POOL_MAX_SIZE,
+            # 등록하지 않은 동적 쿼리(검색/수정 등)도 커넥션별 prepare 결과를 재사용
+            statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+            # 오래 쉬는 커넥션은 닫아 DB 쪽 자원 반환 (다음 acquire 때 다시 연결)
+            max_inactive_connection_lifetime=settings.DB_MAX_INACTIVE_CONNECTION_LIFETIME,
+            timeout=30,
+            connection_class=PreparedConnection,
+            init=self._prepare_statements,
         )
         self.pool = await pool_creation
 
@@ -55,6 +83,16 @@ class Database:
         async with self.pool.acquire() as conn:
             return await conn.fetchval(query, *args)
 
+    async def fetch_prepared(self, name: str, *args) -> List[asyncpg.Record]:
+        """등록된 쿼리로 결과 조회"""
+        async with self.pool.acquire() as conn:
+            return await conn.prepared[name].fetch(*args)
+
+    async def fetchrow_prepared(self, name: str, *args) -> asyncpg.Record:
+        """등록된 쿼리로 단일 행 조회"""
+        async with self.pool.acquire() as conn:
+            return await conn.prepared[name].fetchrow(*args)
+
     @asynccontextmanager
     async def transaction(self):
         """트랜잭션 컨텍스트 매니저"""
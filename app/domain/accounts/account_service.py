@@ -1,6 +1,7 @@
 
 from uuid import UUID
 
+import anyio.to_thread
 from fastapi import HTTPException
 
 from app.core.db import db
@@ -17,6 +18,7 @@ from app.domain.accounts.account_schemas import (
     RefreshTokenRequest,
     RefreshTokenResponse,
 )
+from app.shared.dependencies import invalidate_current_user
 from app.shared.security import password_hasher, jwt_handler
 
 
@@ -37,41 +39,32 @@ class AccountService:
             UserResponse: 생성된 사용자 정보
             
         Raises:
-            HTTPException: 중복된 이메일 또는 DB 오류
+            HTTPException: 중복된 이메일
         """
-        try:
-            # 이메일 중복 확인
-            if await self.repository.check_pid_exists(signup_data.pid):
-                raise HTTPException(
-                    status_code=400,
-                    detail="이미 사용 중인 이메일입니다."
-                )
+        # 이메일 중복 확인
+        if await self.repository.check_pid_exists(signup_data.pid):
+            raise HTTPException(
+                status_code=400,
+                detail="이미 사용 중인 이메일입니다."
+            )
 
-            # 비밀번호 해싱
-            hashed_password = password_hasher.hash_password(signup_data.password)
+        # 비밀번호 해싱 (bcrypt는 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행)
+        hashed_password = await anyio.to_thread.run_sync(password_hasher.hash_password, signup_data.password)
 
-            # 계정 생성 (트랜잭션)
-            async with db.transaction() as conn:
-                data_dict = signup_data.model_dump(exclude={'password'})
-                data_dict['password'] = hashed_password
+        # 계정 생성 (트랜잭션)
+        async with db.transaction() as conn:
+            data_dict = signup_data.model_dump(exclude={'password'})
+            data_dict['password'] = hashed_password
 
-                result = await self.repository.create_account_transaction(conn, data_dict)
+            result = await self.repository.create_account_transaction(conn, data_dict)
 
-                if not result:
-                    raise HTTPException(
-                        status_code=500,
-                        detail="계정 생성에 실패했습니다."
-                    )
+            if not result:
+                raise HTTPException(
+                    status_code=500,
+                    detail="계정 생성에 실패했습니다."
+                )
 
-                return UserResponse.model_validate(dict(result))
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"회원가입 중 오류가 발생했습니다: {str(e)}"
-            )
+            return UserResponse.model_validate(dict(result))
 
     async def signup_admin(self, signup_data: SignUpAdminRequest) -> UserResponse:
         """
@@ -110,57 +103,49 @@ class AccountService:
         Raises:
             HTTPException: 잘못된 이메일/비밀번호
         """
-        try:
-            # 사용자 조회
-            user = await self.repository.get_by_pid(login_data.pid)
-
-            if not user:
-                raise HTTPException(
-                    status_code=401,
-                    detail="이메일 또는 비밀번호가 올바르지 않습니다."
-                )
-
-            # 비밀번호 검증
-            if not password_hasher.verify_password(
-                login_data.password,
-                user['password']
-            ):
-                raise HTTPException(
-                    status_code=401,
-                    detail="이메일 또는 비밀번호가 올바르지 않습니다."
-                )
+        # 사용자 조회
+        user = await self.repository.get_by_pid(login_data.pid)
 
-            # JWT 액세스 토큰 생성
-            access_token_data = {
-                "sub": user['pid'],  # subject (주체)
-                "user_id": str(user['id']),
-                "role": user['role'],
-            }
-            access_token = jwt_handler.create_access_token(access_token_data)
-
-            # JWT 리프레시 토큰 생성 (최소 정보만 포함)
-            refresh_token_data = {
-                "sub": user['pid'],
-            }
-            refresh_token = jwt_handler.create_refresh_token(refresh_token_data)
-
-            # 사용자 정보 (password 제외)
-            user_response = UserResponse.model_validate(dict(user))
-
-            return LoginResponse(
-                access_token=access_token,
-                refresh_token=refresh_token,
-                user=user_response
+        if not user:
+            raise HTTPException(
+                status_code=401,
+                detail="이메일 또는 비밀번호가 올바르지 않습니다."
             )
 
-        except HTTPException:
-            raise
-        except Exception as e:
+        # 비밀번호 검증 (스레드에서 실행)
+        if not await anyio.to_thread.run_sync(
+            password_hasher.verify_password,
+            login_data.password,
+            user['password']
+        ):
             raise HTTPException(
-                status_code=500,
-                detail=f"로그인 중 오류가 발생했습니다: {str(e)}"
+                status_code=401,
+                detail="이메일 또는 비밀번호가 올바르지 않습니다."
             )
 
+        # JWT 액세스 토큰 생성
+        access_token_data = {
+            "sub": user['pid'],  # subject (주체)
+            "user_id": str(user['id']),
+            "role": user['role'],
+        }
+        access_token = jwt_handler.create_access_token(access_token_data)
+
+        # JWT 리프레시 토큰 생성 (최소 정보만 포함)
+        refresh_token_data = {
+            "sub": user['pid'],
+        }
+        refresh_token = jwt_handler.create_refresh_token(refresh_token_data)
+
+        # 사용자 정보 (password 제외)
+        user_response = UserResponse.model_validate(dict(user))
+
+        return LoginResponse(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            user=user_response
+        )
+
     async def change_password(
         self,
         change_data: PasswordChangeRequest
@@ -175,56 +160,49 @@ class AccountService:
             AccountResponse: 성공 메시지
             
         Raises:
-            HTTPException: 잘못된 현재 비밀번호 또는 DB 오류
+            HTTPException: 잘못된 현재 비밀번호
         """
-        try:
-            # 사용자 조회
-            user = await self.repository.get_by_pid(change_data.pid)
+        # 사용자 조회
+        user = await self.repository.get_by_pid(change_data.pid)
 
-            if not user:
-                raise HTTPException(
-                    status_code=404,
-                    detail="사용자를 찾을 수 없습니다."
-                )
+        if not user:
+            raise HTTPException(
+                status_code=404,
+                detail="사용자를 찾을 수 없습니다."
+            )
 
-            # 현재 비밀번호 검증
-            if not password_hasher.verify_password(
-                change_data.current_password,
-                user['password']
-            ):
-                raise HTTPException(
-                    status_code=401,
-                    detail="현재 비밀번호가 올바르지 않습니다."
-                )
+        # 현재 비밀번호 검증 (스레드에서 실행)
+        if not await anyio.to_thread.run_sync(
+            password_hasher.verify_password,
+            change_data.current_password,
+            user['password']
+        ):
+            raise HTTPException(
+                status_code=401,
+                detail="현재 비밀번호가 올바르지 않습니다."
+            )
 
-            # 새 비밀번호 해싱
-            new_hashed_password = password_hasher.hash_password(
-                change_data.new_password
+        # 새 비밀번호 해싱 (스레드에서 실행)
+        new_hashed_password = await anyio.to_thread.run_sync(
+            password_hasher.hash_password,
+            change_data.new_password
+        )
+
+        # 비밀번호 업데이트 (트랜잭션)
+        async with db.transaction() as conn:
+            result = await self.repository.update_password_transaction(
+                conn,
+                change_data.pid,
+                new_hashed_password
             )
 
-            # 비밀번호 업데이트 (트랜잭션)
-            async with db.transaction() as conn:
-                result = await self.repository.update_password_transaction(
-                    conn,
-                    change_data.pid,
-                    new_hashed_password
+            if not result:
+                raise HTTPException(
+                    status_code=500,
+                    detail="비밀번호 변경에 실패했습니다."
                 )
 
-                if not result:
-                    raise HTTPException(
-                        status_code=500,
-                        detail="비밀번호 변경에 실패했습니다."
-                    )
-
-            return AccountResponse(message="비밀번호가 성공적으로 변경되었습니다.")
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"비밀번호 변경 중 오류가 발생했습니다: {str(e)}"
-            )
+        return AccountResponse(message="비밀번호가 성공적으로 변경되었습니다.")
 
     async def delete_account(self, account_id: UUID) -> AccountResponse:
         """
@@ -237,32 +215,27 @@ class AccountService:
             AccountResponse: 성공 메시지
             
         Raises:
-            HTTPException: 계정을 찾을 수 없음 또는 DB 오류
+            HTTPException: 계정을 찾을 수 없음
         """
-        try:
-            async with db.transaction() as conn:
-                result = await self.repository.delete_by_id_transaction(
-                    conn,
-                    str(account_id)
-                )
+        async with db.transaction() as conn:
+            # UUID 객체 그대로 전달 (asyncpg가 16바이트 바이너리로 인코딩, 문자열 변환/재파싱 없음)
+            result = await self.repository.delete_by_id_transaction(
+                conn,
+                account_id
+            )
 
-                if not result:
-                    raise HTTPException(
-                        status_code=404,
-                        detail="계정을 찾을 수 없습니다."
-                    )
+            if not result:
+                raise HTTPException(
+                    status_code=404,
+                    detail="계정을 찾을 수 없습니다."
+                )
 
-            return AccountResponse(
-                message=f"{result['name']} 계정이 성공적으로 삭제되었습니다."
-            )
+        # 삭제된 계정의 토큰이 인증 캐시로 계속 통과하지 않도록 바로 제거
+        invalidate_current_user(account_id)
 
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"계정 삭제 중 오류가 발생했습니다: {str(e)}"
-            )
+        return AccountResponse(
+            message=f"{result['name']} 계정이 성공적으로 삭제되었습니다."
+        )
 
     async def refresh_access_token(
         self,
@@ -280,88 +253,75 @@ class AccountService:
         Raises:
             HTTPException: 유효하지 않은 토큰 또는 사용자를 찾을 수 없음
         """
-        try:
-            # 리프레시 토큰 검증
-            payload = jwt_handler.verify_token(
-                refresh_request.refresh_token,
-                token_type="refresh"
-            )
-
-            if not payload:
-                raise HTTPException(
-                    status_code=401,
-                    detail="유효하지 않거나 만료된 리프레시 토큰입니다."
-                )
-
-            # 사용자 조회
-            pid = payload.get("sub")
-            user = await self.repository.get_by_pid(pid)
-
-            if not user:
-                raise HTTPException(
-                    status_code=404,
-                    detail="사용자를 찾을 수 없습니다."
-                )
+        # 리프레시 토큰 검증
+        payload = jwt_handler.verify_token(
+            refresh_request.refresh_token,
+            token_type="refresh"
+        )
 
-            # 새로운 액세스 토큰 생성
-            access_token_data = {
-                "sub": user['pid'],
-                "user_id": str(user['id']),
-                "role": user['role'],
-            }
-            new_access_token = jwt_handler.create_access_token(access_token_data)
-
-            # 새로운 리프레시 토큰 생성 (보안을 위해 갱신)
-            refresh_token_data = {
-                "sub": user['pid'],
-            }
-            new_refresh_token = jwt_handler.create_refresh_token(refresh_token_data)
-
-            return RefreshTokenResponse(
-                access_token=new_access_token,
-                refresh_token=new_refresh_token
+        if not payload:
+            raise HTTPException(
+                status_code=401,
+                detail="유효하지 않거나 만료된 리프레시 토큰입니다."
             )
 
-        except HTTPException:
-            raise
-        except Exception as e:
+        # 사용자 조회
+        pid = payload.get("sub")
+        user = await self.repository.get_by_pid(pid)
+
+        if not user:
             raise HTTPException(
-                status_code=500,
-                detail=f"토큰 갱신 중 오류가 발생했습니다: {str(e)}"
+                status_code=404,
+                detail="사용자를 찾을 수 없습니다."
             )
+
+        # 새로운 액세스 토큰 생성
+        access_token_data = {
+            "sub": user['pid'],
+            "user_id": str(user['id']),
+            "role": user['role'],
+        }
+        new_access_token = jwt_handler.create_access_token(access_token_data)
+
+        # 새로운 리프레시 토큰 생성 (보안을 위해 갱신)
+        refresh_token_data = {
+            "sub": user['pid'],
+        }
+        new_refresh_token = jwt_handler.create_refresh_token(refresh_token_data)
+
+        return RefreshTokenResponse(
+            access_token=new_access_token,
+            refresh_token=new_refresh_token
+        )
     
     async def get_user_profile(self, pid: str) -> UserResponse:
         """
         사용자 프로필 조회
         """
-        try:
-            user = await self.repository.get_by_pid(pid)
-            if not user:
-                raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
-            return UserResponse.model_validate(dict(user))
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"사용자 정보 조회 중 오류가 발생했습니다: {str(e)}")
+        user = await self.repository.get_by_pid(pid)
+        if not user:
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+        return UserResponse.model_validate(dict(user))
     
     async def change_current_user_password(self, pid: str, current_password: str, new_password: str) -> AccountResponse:
         """
         현재 로그인한 사용자의 비밀번호 변경
         """
-        try:
-            # 현재 비밀번호 검증
-            is_valid = await self.repository.verify_password(pid, current_password)
-            if not is_valid:
-                raise HTTPException(status_code=400, detail="현재 비밀번호가 올바르지 않습니다.")
+        # 현재 비밀번호 검증 (스레드에서 실행)
+        user = await self.repository.get_by_pid(pid)
+        if not user or not await anyio.to_thread.run_sync(
+            password_hasher.verify_password,
+            current_password,
+            user['password']
+        ):
+            raise HTTPException(status_code=400, detail="현재 비밀번호가 올바르지 않습니다.")
             
-            # 새 비밀번호로 업데이트
-            await self.repository.change_password_with_transaction(pid, new_password)
+        # 새 비밀번호 해싱 (스레드에서 실행, 설정된 bcrypt cost 사용) 후 업데이트
+        password_hash = await anyio.to_thread.run_sync(password_hasher.hash_password, new_password)
+        async with db.transaction() as conn:
+            await self.repository.update_password_transaction(conn, pid, password_hash)
             
-            return AccountResponse(message="비밀번호가 성공적으로 변경되었습니다.")
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"비밀번호 변경 중 오류가 발생했습니다: {str(e)}")
+        return AccountResponse(message="비밀번호가 성공적으로 변경되었습니다.")
 
 
 account_service = AccountService(account_repository)
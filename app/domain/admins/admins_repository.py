@@ -6,7 +6,6 @@
 """
 from typing import Optional, List
 from datetime import date, datetime, timedelta
-from uuid import UUID
 
 import asyncpg
 
@@ -15,25 +14,49 @@ from app.core.db import db
 from app.domain.admins.admins_schemas import ModelSearchParams, CameraTestStatus
 
 
+# 대시보드 통계 쿼리 (매 요청마다 실행되므로 커넥션 생성 시 미리 prepare)
+# - 최근 N일 일별 집계를 한 번만 스캔하고, 금일 요약도 같은 집계에서 꺼냄
+_DASHBOARD_STATS_QUERY = """
+    WITH daily AS (
+        SELECT
+            DATE(visited_at) AS date,
+            COUNT(DISTINCT model_id) AS count,
+            COUNT(DISTINCT model_id) FILTER (WHERE is_tested = 'PENDING') AS pending
+        FROM cameratest
+        WHERE visited_at >= CURRENT_DATE - ($1::int - 1)
+        AND visited_at < CURRENT_DATE + 1
+        GROUP BY DATE(visited_at)
+    )
+    SELECT
+        CURRENT_DATE AS today,
+        COALESCE((SELECT count FROM daily WHERE date = CURRENT_DATE), 0) AS today_registrations,
+        COALESCE((SELECT pending FROM daily WHERE date = CURRENT_DATE), 0) AS today_incomplete_camera_tests,
+        0 AS incomplete_addresses,
+        ARRAY(SELECT date FROM daily ORDER BY date) AS daily_dates,
+        ARRAY(SELECT count FROM daily ORDER BY date) AS daily_counts
+"""
+
+db.register_statement("dashboard_stats", _DASHBOARD_STATS_QUERY)
+
 class AdminsRepository(BaseRepository):
     """관리자 Repository"""
+    __slots__ = ()
     
     def __init__(self):
         super().__init__("models")
 
     # ===== 모델 검색 =====
     
-    async def search_models(
+    def _build_search_conditions(
         self,
         search_params: ModelSearchParams,
         is_foreigner: bool
-    ) -> List[asyncpg.Record]:
+    ) -> tuple[List[str], list]:
         """
-        모델 검색 (필터링)
+        모델 검색 WHERE 조건 생성 (검색/개수 조회 공통)
         
-        Args:
-            search_params: 검색 조건
-            is_foreigner: True=해외모델, False=국내모델
+        Returns:
+            (조건 목록, 바인딩 파라미터 목록)
         """
         conditions = ["is_foreigner = $1"]
         params = [is_foreigner]
@@ -93,7 +116,25 @@ class AdminsRepository(BaseRepository):
             params.append(search_params.korean_level)
             param_index += 1
         
+        return conditions, params
+
+    async def search_models(
+        self,
+        search_params: ModelSearchParams,
+        is_foreigner: bool
+    ) -> List[asyncpg.Record]:
+        """
+        모델 검색 (필터링)
+        - 각 행에 페이징 전 전체 결과 수(total_count)를 함께 반환 (COUNT(*) OVER ())
+        - 응답 스키마(ReadDomesticModel/ReadGlobalModel)에 필요한 컬럼만 조회 (created_at은 정렬에만 사용)
+        
+        Args:
+            search_params: 검색 조건
+            is_foreigner: True=해외모델, False=국내모델
+        """
+        conditions, params = self._build_search_conditions(search_params, is_foreigner)
         where_clause = " AND ".join(conditions)
+        param_index = len(params) + 1
         
         # 페이징
         offset = (search_params.page - 1) * search_params.page_size
@@ -108,7 +149,7 @@ class AdminsRepository(BaseRepository):
                 height, weight, top_size, bottom_size, shoes_size,
                 has_tattoo, tattoo_location, tattoo_size,
                 instagram, youtube, {f"kakaotalk," if is_foreigner else "tictok,"}
-                created_at
+                COUNT(*) OVER () AS total_count
             FROM {self.table_name}
             WHERE {where_clause}
             ORDER BY created_at DESC
@@ -123,46 +164,8 @@ class AdminsRepository(BaseRepository):
         search_params: ModelSearchParams,
         is_foreigner: bool
     ) -> int:
-        """모델 검색 결과 총 개수"""
-        conditions = ["is_foreigner = $1"]
-        params = [is_foreigner]
-        param_index = 2
-        
-        if search_params.name:
-            conditions.append(f"name ILIKE ${param_index}")
-            params.append(f"%{search_params.name}%")
-            param_index += 1
-        
-        if search_params.gender:
-            conditions.append(f"gender = ${param_index}")
-            params.append(search_params.gender)
-            param_index += 1
-        
-        if search_params.address_city:
-            conditions.append(f"address_city ILIKE ${param_index}")
-            params.append(f"%{search_params.address_city}%")
-            param_index += 1
-        
-        if search_params.address_district:
-            conditions.append(f"address_district ILIKE ${param_index}")
-            params.append(f"%{search_params.address_district}%")
-            param_index += 1
-        
-        if search_params.special_abilities:
-            conditions.append(f"special_abilities ILIKE ${param_index}")
-            params.append(f"%{search_params.special_abilities}%")
-            param_index += 1
-        
-        if search_params.other_languages:
-            conditions.append(f"other_languages ILIKE ${param_index}")
-            params.append(f"%{search_params.other_languages}%")
-            param_index += 1
-        
-        if search_params.korean_level and is_foreigner:
-            conditions.append(f"korean_level = ${param_index}")
-            params.append(search_params.korean_level)
-            param_index += 1
-        
+        """모델 검색 결과 총 개수 (마지막 페이지를 넘어 search_models 결과가 비었을 때만 사용)"""
+        conditions, params = self._build_search_conditions(search_params, is_foreigner)
         where_clause = " AND ".join(conditions)
         
         query = f"""
@@ -176,88 +179,67 @@ class AdminsRepository(BaseRepository):
 
     # ===== 신체 사이즈 조회 =====
     
-    async def get_physical_size(self, model_id: UUID) -> Optional[asyncpg.Record]:
+    async def get_physical_size(self, model_id: str) -> Optional[asyncpg.Record]:
         """모델 신체 사이즈 조회"""
         query = f"""
             SELECT id as model_id, name, height, weight, top_size, bottom_size, shoes_size
             FROM {self.table_name}
-            WHERE id = $1
+            WHERE id = $1::uuid
         """
         return await db.fetchrow(query, model_id)
 
     # ===== 카메라 테스트 관리 =====
     
-    async def get_camera_test(self, model_id: UUID) -> Optional[asyncpg.Record]:
-        """카메라 테스트 조회"""
-        query = """
-            SELECT id, model_id, is_tested, visited_at
-            FROM cameratest
-            WHERE model_id = $1
-            ORDER BY visited_at DESC
-            LIMIT 1
+    async def create_camera_test(self, model_id: str) -> Optional[asyncpg.Record]:
         """
-        return await db.fetchrow(query, model_id)
-
-    async def get_camera_test_today(self, model_id: UUID) -> Optional[asyncpg.Record]:
-        """금일 카메라 테스트 조회"""
-        query = """
-            SELECT id, model_id, is_tested, visited_at
-            FROM cameratest
-            WHERE model_id = $1
-            AND visited_at >= CURRENT_DATE
-            AND visited_at < CURRENT_DATE + INTERVAL '1 day'
-            ORDER BY visited_at DESC
-            LIMIT 1
+        카메라 테스트 등록
+        - 단일 쿼리이므로 명시적 트랜잭션 없이 실행 (자동 커밋)
+        - 금일 등록 건이 없을 때만 INSERT (조회 + 등록을 한 번의 쿼리로 처리)
+        - 이미 금일 등록되어 있으면 None 반환
+        - 동시 요청은 (model_id, 방문일) 유니크 인덱스 충돌 시 DO NOTHING 으로 처리 (migrations/002)
+        - visited_at은 DB 시각(now())으로 기록
         """
-        return await db.fetchrow(query, model_id)
-    
-    async def create_camera_test_transaction(
-        self,
-        conn: asyncpg.Connection,
-        model_id: UUID,
-        visited_at: datetime
-    ) -> asyncpg.Record:
-        """카메라 테스트 등록 (트랜잭션)"""
         query = """
             INSERT INTO cameratest (model_id, is_tested, visited_at)
-            VALUES ($1, $2::camerateststatusenum, $3)
+            SELECT $1::uuid, $2::camerateststatusenum, now()
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM cameratest
+                WHERE model_id = $1::uuid
+                AND visited_at >= CURRENT_DATE
+                AND visited_at < CURRENT_DATE + INTERVAL '1 day'
+            )
+            ON CONFLICT DO NOTHING
             RETURNING id, model_id, is_tested, visited_at
         """
-        return await conn.fetchrow(query, model_id, 'PENDING', visited_at)
-    
-    async def update_camera_test_status_transaction(
+        return await db.fetchrow(query, model_id, 'PENDING')
+
+    async def update_camera_test_status(
         self,
-        conn: asyncpg.Connection,
-        model_id: UUID,
+        model_id: str,
         status: CameraTestStatus
     ) -> Optional[asyncpg.Record]:
-        """카메라 테스트 상태 변경 (트랜잭션)"""
+        """카메라 테스트 상태 변경 (단일 쿼리, 자동 커밋)"""
         query = """
             UPDATE cameratest
             SET is_tested = $2::camerateststatusenum
-            WHERE model_id = $1
+            WHERE model_id = $1::uuid
             RETURNING id, model_id, is_tested, visited_at
         """
-        return await conn.fetchrow(query, model_id, status.value)
+        return await db.fetchrow(query, model_id, status.value)
 
     # ===== 대시보드 통계 =====
-    
-    async def get_daily_registrations(
-        self,
-        start_date: date,
-        end_date: date
-    ) -> List[asyncpg.Record]:
-        """일별 등록 인원 통계 (중복 제거: 같은 model_id는 1명으로 카운트)"""
-        query = """
-            SELECT
-                DATE(visited_at) as date,
-                COUNT(DISTINCT model_id) as count
-            FROM cameratest
-            WHERE DATE(visited_at) BETWEEN $1 AND $2
-            GROUP BY DATE(visited_at)
-            ORDER BY date DESC
+
+    async def get_dashboard_stats(self, days: int) -> asyncpg.Record:
         """
-        return await db.fetch(query, start_date, end_date)
+        대시보드 통계 (한 번의 조회, 하나의 커넥션으로 모든 항목 집계)
+        - today: DB 기준 오늘 날짜 (주간/월간 통계와 동일한 날짜 경계)
+        - today_registrations: 금일 등록 인원 (중복 제거: 같은 model_id는 1명으로 카운트)
+        - today_incomplete_camera_tests: 금일 카메라테스트 미완료 인원 (PENDING 상태의 고유 model_id 수)
+        - incomplete_addresses: 주소록 등록 미완료 인원 (현재 테이블 미구현이므로 0 고정)
+        - daily_dates, daily_counts: 최근 N일(오늘 포함) 일별 등록 인원 (등록이 있는 날짜만)
+        """
+        return await db.fetchrow_prepared("dashboard_stats", days)
 
     async def get_cameratests_by_date(self, target_date: date) -> List[asyncpg.Record]:
         """특정 날짜의 카메라테스트 + 모델 정보
@@ -291,49 +273,23 @@ class AdminsRepository(BaseRepository):
         """
         return await db.fetch(query, target_date)
     
-    async def get_today_registrations_count(self) -> int:
-        """금일 등록 인원 수 (중복 제거: 같은 model_id는 1명으로 카운트)"""
-        query = """
-            SELECT COUNT(DISTINCT model_id) as count
-            FROM cameratest
-            WHERE DATE(visited_at) = CURRENT_DATE
+    async def delete_model(self, model_id: str) -> Optional[asyncpg.Record]:
         """
-        result = await db.fetchrow(query)
-        return result["count"] if result else 0
-    
-    async def get_today_incomplete_camera_tests_count(self) -> int:
-        """금일 카메라테스트 미완료 인원 (중복 제거: 완료가 아닌 상태의 고유 model_id 수)"""
-        query = """
-            SELECT COUNT(DISTINCT model_id) as count
-            FROM cameratest
-            WHERE DATE(visited_at) = CURRENT_DATE AND is_tested = 'PENDING'
+        모델 삭제 (카메라 테스트 기록 먼저 삭제 후 모델 삭제)
+        - 쓰기 CTE 단일 문장이므로 명시적 트랜잭션 없이도 원자적으로 실행 (자동 커밋)
+        - 외래키 검사는 문장 끝에 이루어지므로 같은 문장에서 삭제한 cameratest 행은 참조로 남지 않음
+        - 해당 ID의 모델이 없으면 아무것도 삭제하지 않고 None 반환
         """
-        result = await db.fetchrow(query)
-        return result["count"] if result else 0
-    
-    async def get_incomplete_addresses_count(self) -> int:
-        """주소록 등록 미완료 인원: 현재 테이블 미구현이므로 0 고정 반환"""
-        return 0
-    
-    async def model_exists_transaction(self, conn: asyncpg.Connection, model_id: str) -> bool:
-        """트랜잭션 내에서 모델 존재 여부 확인"""
-        query = "SELECT EXISTS(SELECT 1 FROM models WHERE id = $1)"
-        result = await conn.fetchval(query, model_id)
-        return result
-    
-    async def delete_model_transaction(self, conn: asyncpg.Connection, model_id: str) -> dict | None:
-        """트랜잭션 내에서 모델 삭제 (cameratest 먼저 삭제 후 models 삭제)"""
-        # 1단계: cameratest 삭제 (외래키 제약 조건 해결)
-        await conn.execute("DELETE FROM cameratest WHERE model_id = $1", model_id)
-        
-        # 2단계: models 삭제
         query = """
+            WITH deleted_camera_tests AS (
+                DELETE FROM cameratest
+                WHERE model_id = $1
+            )
             DELETE FROM models
             WHERE id = $1
             RETURNING id, name
         """
-        result = await conn.fetchrow(query, model_id)
-        return dict(result) if result else None
+        return await db.fetchrow(query, model_id)
     
     async def get_filter_options(self) -> dict:
         """필터 옵션들을 수집"""
@@ -4,12 +4,10 @@
 - 카메라 테스트 관리
 - 대시보드 통계
 """
-from uuid import UUID
-
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Path, Query
 from datetime import date
 
-from app.shared import require_admin, require_admin_or_director
+from app.shared import require_admin, require_admin_or_director, UUID_PATTERN
 from app.domain.models.models_services import models_services
 from app.domain.models.models_schemas import CreateDomesticModel, CreateGlobalModel, UpdateDomesticModel, UpdateGlobalModel
 from app.domain.admins.admins_service import admins_service
@@ -157,7 +155,7 @@ async def update_global_model(
 
 @app.get("/models/{model_id}/physical", response_model=PhysicalSizeResponse)
 async def get_physical_size(
-    model_id: UUID,
+    model_id: str = Path(..., pattern=UUID_PATTERN, description="모델 ID"),
     current_user: dict = Depends(require_admin)
 ):
     """
@@ -184,8 +182,8 @@ async def create_camera_test(
 
 @app.put("/models/{model_id}/cameraTest", response_model=CameraTestResponse)
 async def update_camera_test_status(
-    model_id: UUID,
     request: CameraTestStatusUpdate,
+    model_id: str = Path(..., pattern=UUID_PATTERN, description="모델 ID"),
     current_user: dict = Depends(require_admin_or_director)
 ):
     """
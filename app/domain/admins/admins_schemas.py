@@ -9,7 +9,9 @@ from typing import Optional, List
 from enum import Enum
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.shared.validators import UUID_PATTERN
 
 
 # ===== 카메라 테스트 관련 =====
@@ -34,7 +36,7 @@ class CameraTestStatus(str, Enum):
 
 class CameraTestCreate(BaseModel):
     """카메라 테스트 등록 요청"""
-    model_id: UUID = Field(..., description="모델 ID")
+    model_id: str = Field(..., pattern=UUID_PATTERN, description="모델 ID")
 
 
 class CameraTestStatusUpdate(BaseModel):
@@ -56,7 +58,9 @@ class CameraTestResponse(BaseModel):
 # ===== 모델 검색 관련 =====
 
 class ModelSearchParams(BaseModel):
-    """모델 검색 조건"""
+    """모델 검색 조건 (frozen: 해시 가능하므로 검색 결과 캐시 키로 사용)"""
+    model_config = ConfigDict(frozen=True)
+
     name: Optional[str] = Field(None, description="이름 (부분 검색)")
     gender: Optional[str] = Field(None, description="성별")
     nationality: Optional[str] = Field(None, description="국적")
@@ -6,11 +6,11 @@
 """
 from datetime import date, datetime, timedelta
 from typing import List
-from uuid import UUID
 
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 
-from app.core.db import db
+from app.shared import TTLCache
 from app.domain.admins.admins_repository import admins_repository
 from app.domain.admins.admins_schemas import (
     ModelSearchParams,
@@ -27,11 +27,39 @@ from app.domain.admins.admins_schemas import (
     DailyRegistration,
 )
 from app.domain.models.models_schemas import ReadDomesticModel, ReadGlobalModel
+from app.domain.models.models_services import models_services
+
+
+# 검색 결과 목록 검증기 (페이지 단위로 한 번에 검증, 스키마 조회를 매 행마다 반복하지 않음)
+_DOMESTIC_LIST_ADAPTER = TypeAdapter(List[ReadDomesticModel])
+_GLOBAL_LIST_ADAPTER = TypeAdapter(List[ReadGlobalModel])
+
+# 기준 날짜 -> (주간 7일, 월간 30일) 날짜 목록, 날짜가 바뀔 때만 다시 계산
+_DATE_CACHE: dict[date, tuple[tuple[date, ...], tuple[date, ...]]] = {}
+
+
+def _get_dashboard_dates(today: date) -> tuple[tuple[date, ...], tuple[date, ...]]:
+    """대시보드 주간/월간 날짜 목록 (오늘 포함, 오래된 날짜부터)"""
+    dates = _DATE_CACHE.get(today)
+    if dates is None:
+        week_start = today - timedelta(days=6)  # 오늘 포함 7일
+        month_start = today - timedelta(days=29)  # 오늘 포함 30일
+        dates = (
+            tuple(week_start + timedelta(days=i) for i in range(7)),
+            tuple(month_start + timedelta(days=i) for i in range(30)),
+        )
+        _DATE_CACHE.clear()
+        _DATE_CACHE[today] = dates
+    return dates
 
 
 class AdminsService:
     def __init__(self):
         self.repository = admins_repository
+        # (검색 조건, 해외 여부, 모델 데이터 버전) -> 검색 결과, 페이지 이동 시 반복 조회 흡수용 (15초)
+        self.search_cache = TTLCache(ttl=15, maxsize=128)
+        # 대시보드 응답 (통계는 분 단위로만 의미 있게 변하므로 60초)
+        self.dashboard_cache = TTLCache(ttl=60, maxsize=1)
 
     # ===== 모델 검색 =====
 
@@ -42,28 +70,28 @@ class AdminsService:
         """
         국내 모델 검색
         """
-        try:
-            # 검색 결과 조회
-            models = await self.repository.search_models(search_params, is_foreigner=False)
-            
-            # 총 개수 조회
-            total_count = await self.repository.count_models(search_params, is_foreigner=False)
-            
-            # Pydantic 모델로 변환
-            model_list = [ReadDomesticModel.model_validate(dict(model)) for model in models]
-            
-            return {
-                "total_count": total_count,
-                "page": search_params.page,
-                "page_size": search_params.page_size,
-                "total_pages": (total_count + search_params.page_size - 1) // search_params.page_size,
-                "models": model_list,
-            }
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"국내 모델 검색 중 오류가 발생했습니다: {str(e)}"
-            )
+        cache_key = (search_params, False, models_services.data_version)
+        cached = self.search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # 검색 결과 + 총 개수 조회 (한 번의 쿼리)
+        models = await self.repository.search_models(search_params, is_foreigner=False)
+        total_count = await self._get_total_count(models, search_params, is_foreigner=False)
+        
+        # Pydantic 모델로 변환
+        # asyncpg Record는 속성 접근을 지원하지 않아 from_attributes 대신 dict로 변환
+        model_list = _DOMESTIC_LIST_ADAPTER.validate_python(map(dict, models))
+        
+        result = {
+            "total_count": total_count,
+            "page": search_params.page,
+            "page_size": search_params.page_size,
+            "total_pages": (total_count + search_params.page_size - 1) // search_params.page_size,
+            "models": model_list,
+        }
+        self.search_cache.set(cache_key, result)
+        return result
 
     async def search_global_models(
         self,
@@ -72,52 +100,60 @@ class AdminsService:
         """
         해외 모델 검색
         """
-        try:
-            # 검색 결과 조회
-            models = await self.repository.search_models(search_params, is_foreigner=True)
-            
-            # 총 개수 조회
-            total_count = await self.repository.count_models(search_params, is_foreigner=True)
-            
-            # Pydantic 모델로 변환
-            model_list = [ReadGlobalModel.model_validate(dict(model)) for model in models]
-            
-            return {
-                "total_count": total_count,
-                "page": search_params.page,
-                "page_size": search_params.page_size,
-                "total_pages": (total_count + search_params.page_size - 1) // search_params.page_size,
-                "models": model_list,
-            }
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"해외 모델 검색 중 오류가 발생했습니다: {str(e)}"
-            )
+        cache_key = (search_params, True, models_services.data_version)
+        cached = self.search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # 검색 결과 + 총 개수 조회 (한 번의 쿼리)
+        models = await self.repository.search_models(search_params, is_foreigner=True)
+        total_count = await self._get_total_count(models, search_params, is_foreigner=True)
+        
+        # Pydantic 모델로 변환
+        model_list = _GLOBAL_LIST_ADAPTER.validate_python(map(dict, models))
+        
+        result = {
+            "total_count": total_count,
+            "page": search_params.page,
+            "page_size": search_params.page_size,
+            "total_pages": (total_count + search_params.page_size - 1) // search_params.page_size,
+            "models": model_list,
+        }
+        self.search_cache.set(cache_key, result)
+        return result
+
+    async def _get_total_count(
+        self,
+        models: List,
+        search_params: ModelSearchParams,
+        is_foreigner: bool
+    ) -> int:
+        """
+        검색 결과 총 개수
+        - 결과 행의 total_count 사용 (COUNT(*) OVER ())
+        - 마지막 페이지를 넘어 결과가 없을 때만 별도 개수 조회
+        """
+        if models:
+            return models[0]["total_count"]
+        if search_params.page > 1:
+            return await self.repository.count_models(search_params, is_foreigner=is_foreigner)
+        return 0
 
     # ===== 신체 사이즈 조회 =====
 
-    async def get_physical_size(self, model_id: UUID) -> PhysicalSizeResponse:
+    async def get_physical_size(self, model_id: str) -> PhysicalSizeResponse:
         """
         모델 신체 사이즈 조회
         """
-        try:
-            result = await self.repository.get_physical_size(model_id)
-            
-            if not result:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"ID {model_id}인 모델을 찾을 수 없습니다."
-                )
-            
-            return PhysicalSizeResponse.model_validate(dict(result))
-        except HTTPException:
-            raise
-        except Exception as e:
+        result = await self.repository.get_physical_size(model_id)
+        
+        if not result:
             raise HTTPException(
-                status_code=500,
-                detail=f"신체 사이즈 조회 중 오류가 발생했습니다: {str(e)}"
+                status_code=404,
+                detail=f"ID {model_id}인 모델을 찾을 수 없습니다."
             )
+        
+        return PhysicalSizeResponse.model_validate(dict(result))
 
     # ===== 카메라 테스트 관리 =====
 
@@ -127,75 +163,41 @@ class AdminsService:
     ) -> CameraTestResponse:
         """
         카메라 테스트 등록
-        - 현재 시간을 기준으로 등록
+        - 현재 시간(DB 시각)을 기준으로 등록
         """
-        try:
-            # 이미 등록된 카메라 테스트가 있는지 확인
-            existing = await self.repository.get_camera_test_today(request.model_id)
-            if existing:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"모델 ID {request.model_id}는 이미 카메라 테스트에 등록되어 있습니다."
-                )
-            
-            # 현재 시간으로 등록
-            visited_at = datetime.now()
-            
-            async with db.transaction() as conn:
-                result = await self.repository.create_camera_test_transaction(
-                    conn=conn,
-                    model_id=request.model_id,
-                    visited_at=visited_at
-                )
-            
-            return CameraTestResponse.model_validate(dict(result))
-        except HTTPException:
-            raise
-        except Exception as e:
+        # 금일 등록 건이 있으면 None
+        result = await self.repository.create_camera_test(model_id=request.model_id)
+        
+        if not result:
             raise HTTPException(
-                status_code=500,
-                detail=f"카메라 테스트 등록 중 오류가 발생했습니다: {str(e)}"
+                status_code=400,
+                detail=f"모델 ID {request.model_id}는 이미 카메라 테스트에 등록되어 있습니다."
             )
+        
+        return CameraTestResponse.model_validate(dict(result))
 
     async def update_camera_test_status(
         self,
-        model_id: UUID,
+        model_id: str,
         request: CameraTestStatusUpdate
     ) -> CameraTestResponse:
         """
         카메라 테스트 상태 변경
         - 준비중 → 테스트중 → 완료
         """
-        try:
-            # 카메라 테스트가 등록되어 있는지 확인
-            existing = await self.repository.get_camera_test(model_id)
-            if not existing:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"모델 ID {model_id}의 카메라 테스트를 찾을 수 없습니다."
-                )
-            
-            async with db.transaction() as conn:
-                result = await self.repository.update_camera_test_status_transaction(
-                    conn=conn,
-                    model_id=model_id,
-                    status=request.status
-                )
-            
-            if not result:
-                raise HTTPException(
-                    status_code=500,
-                    detail="카메라 테스트 상태 변경에 실패했습니다."
-                )
-            
-            return CameraTestResponse.model_validate(dict(result))
-        except HTTPException:
-            raise
-        except Exception as e:
+        result = await self.repository.update_camera_test_status(
+            model_id=model_id,
+            status=request.status
+        )
+        
+        # UPDATE ... RETURNING 결과가 없으면 등록된 카메라 테스트가 없는 것
+        if not result:
             raise HTTPException(
-                status_code=500,
-                detail=f"카메라 테스트 상태 변경 중 오류가 발생했습니다: {str(e)}"
+                status_code=404,
+                detail=f"모델 ID {model_id}의 카메라 테스트를 찾을 수 없습니다."
             )
+        
+        return CameraTestResponse.model_validate(dict(result))
 
     # ===== 대시보드 통계 =====
 
@@ -208,84 +210,57 @@ class AdminsService:
         
         데이터가 없을 때도 200 OK와 기본값(0, 빈 배열) 반환
         """
+        cached = self.dashboard_cache.get("dashboard")
+        if cached is not None:
+            return cached
+
         try:
-            # 1. 요약 정보 (기본값: 0)
-            today_registrations = 0
-            today_incomplete_camera_tests = 0
-            incomplete_addresses = 0
-            
-            try:
-                today_registrations = await self.repository.get_today_registrations_count() or 0
-                today_incomplete_camera_tests = await self.repository.get_today_incomplete_camera_tests_count() or 0
-                incomplete_addresses = await self.repository.get_incomplete_addresses_count() or 0
-            except Exception as e:
-                # 개별 통계 조회 실패해도 계속 진행
-                print(f"요약 정보 조회 중 일부 오류 발생: {str(e)}")
-            
+            # 요약 + 일별 통계를 한 번의 쿼리로 조회
+            # 주간(7일)은 월간(30일) 범위에 포함되므로 30일 데이터만 조회
+            stats = await self.repository.get_dashboard_stats(30)
+
+            # 1. 요약 정보
             summary = DashboardSummary(
-                today_registrations=today_registrations,
-                today_incomplete_camera_tests=today_incomplete_camera_tests,
-                incomplete_addresses=incomplete_addresses,
+                today_registrations=stats["today_registrations"],
+                today_incomplete_camera_tests=stats["today_incomplete_camera_tests"],
+                incomplete_addresses=stats["incomplete_addresses"],
             )
-            
-            # 2. 주간 통계 (최근 7일)
-            today = date.today()
-            week_start = today - timedelta(days=6)  # 오늘 포함 7일
-            weekly_data = []
-            
-            try:
-                weekly_data = await self.repository.get_daily_registrations(week_start, today) or []
-            except Exception as e:
-                # 주간 통계 조회 실패해도 빈 배열로 계속 진행
-                print(f"주간 통계 조회 중 오류 발생: {str(e)}")
-            
+
+            # 기준 날짜는 DB의 CURRENT_DATE를 사용 (서버 TZ와 무관하게 요약 통계와 같은 날짜 경계)
+            weekly_dates, monthly_dates = _get_dashboard_dates(stats["today"])
+
             # 날짜별로 매핑 (데이터가 없는 날짜는 0으로)
-            weekly_map = {row["date"]: row["count"] for row in weekly_data} if weekly_data else {}
+            monthly_map = dict(zip(stats["daily_dates"], stats["daily_counts"]))
+
+            # 2. 주간 통계 (최근 7일)
             weekly_registrations = [
-                DailyRegistration(
-                    date=week_start + timedelta(days=i),
-                    count=weekly_map.get(week_start + timedelta(days=i), 0)
-                )
-                for i in range(7)
+                DailyRegistration(date=d, count=monthly_map.get(d, 0))
+                for d in weekly_dates
             ]
             
             weekly_stats = DashboardWeeklyStats(daily_registrations=weekly_registrations)
             
             # 3. 월간 통계 (최근 30일)
-            month_start = today - timedelta(days=29)  # 오늘 포함 30일
-            monthly_data = []
-            
-            try:
-                monthly_data = await self.repository.get_daily_registrations(month_start, today) or []
-            except Exception as e:
-                # 월간 통계 조회 실패해도 빈 배열로 계속 진행
-                print(f"월간 통계 조회 중 오류 발생: {str(e)}")
-            
-            # 날짜별로 매핑
-            monthly_map = {row["date"]: row["count"] for row in monthly_data} if monthly_data else {}
             monthly_registrations = [
-                DailyRegistration(
-                    date=month_start + timedelta(days=i),
-                    count=monthly_map.get(month_start + timedelta(days=i), 0)
-                )
-                for i in range(30)
+                DailyRegistration(date=d, count=monthly_map.get(d, 0))
+                for d in monthly_dates
             ]
             
             monthly_stats = DashboardMonthlyStats(daily_registrations=monthly_registrations)
             
-            return DashboardResponse(
+            response = DashboardResponse(
                 summary=summary,
                 weekly_stats=weekly_stats,
                 monthly_stats=monthly_stats,
             )
+            self.dashboard_cache.set("dashboard", response)
+            return response
         except Exception as e:
             # 최종 방어: 모든 것이 실패해도 기본값 반환
             print(f"대시보드 통계 조회 중 치명적 오류 발생: {str(e)}")
             
             # 기본 응답 생성
-            today = date.today()
-            week_start = today - timedelta(days=6)
-            month_start = today - timedelta(days=29)
+            weekly_dates, monthly_dates = _get_dashboard_dates(date.today())
             
             return DashboardResponse(
                 summary=DashboardSummary(
@@ -295,14 +270,12 @@ class AdminsService:
                 ),
                 weekly_stats=DashboardWeeklyStats(
                     daily_registrations=[
-                        DailyRegistration(date=week_start + timedelta(days=i), count=0)
-                        for i in range(7)
+                        DailyRegistration(date=d, count=0) for d in weekly_dates
                     ]
                 ),
                 monthly_stats=DashboardMonthlyStats(
                     daily_registrations=[
-                        DailyRegistration(date=month_start + timedelta(days=i), count=0)
-                        for i in range(30)
+                        DailyRegistration(date=d, count=0) for d in monthly_dates
                     ]
                 ),
             )
@@ -313,72 +286,49 @@ class AdminsService:
         Args:
             target_date: 조회할 날짜 (기본값: 오늘)
         """
-        try:
-            if target_date is None:
-                target_date = date.today()
-            rows = await self.repository.get_cameratests_by_date(target_date)
-            return [
-                {
-                    "id": r["id"],
-                    "model_id": r["model_id"],
-                    "is_tested": r["is_tested"],
-                    "visited_at": r["visited_at"],
-                    "name": r["name"],
-                    "birth_date": r["birth_date"],
-                    "nationality": r["nationality"],
-                    "height": r["height"],
-                    "agency_name": r["agency_name"],
-                    "visa_type": r["visa_type"],
-                }
-                for r in rows
-            ]
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"카메라테스트 목록 조회 중 오류가 발생했습니다: {str(e)}"
-            )
+        if target_date is None:
+            target_date = date.today()
+        rows = await self.repository.get_cameratests_by_date(target_date)
+        return [
+            {
+                "id": r["id"],
+                "model_id": r["model_id"],
+                "is_tested": r["is_tested"],
+                "visited_at": r["visited_at"],
+                "name": r["name"],
+                "birth_date": r["birth_date"],
+                "nationality": r["nationality"],
+                "height": r["height"],
+                "agency_name": r["agency_name"],
+                "visa_type": r["visa_type"],
+            }
+            for r in rows
+        ]
     
     async def delete_model(self, model_id: str) -> dict:
         """
-        모델 삭제 (트랜잭션 처리)
-        - cameratest 기록은 유지
+        모델 삭제
+        - 카메라 테스트 기록과 모델을 한 번의 쿼리로 삭제 (존재 확인 조회 없이 DELETE ... RETURNING 결과로 판단)
         """
-        try:
-            async with db.transaction() as conn:
-                # 트랜잭션 내에서 모델 존재 확인
-                if not await self.repository.model_exists_transaction(conn, model_id):
-                    raise HTTPException(status_code=404, detail="모델을 찾을 수 없습니다.")
-                
-                # 트랜잭션 내에서 모델 삭제
-                deleted_model = await self.repository.delete_model_transaction(conn, model_id)
-                if not deleted_model:
-                    raise HTTPException(status_code=500, detail="모델 삭제에 실패했습니다.")
-                
-                return {
-                    "message": f"모델 '{deleted_model['name']}'이 성공적으로 삭제되었습니다.",
-                    "model_id": model_id,
-                    "deleted_at": datetime.now().isoformat()
-                }
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"모델 삭제 중 오류가 발생했습니다: {str(e)}"
-            )
+        deleted_model = await self.repository.delete_model(model_id)
+        if not deleted_model:
+            raise HTTPException(status_code=404, detail="모델을 찾을 수 없습니다.")
+
+        # 커밋 후 모델 데이터 캐시 무효화
+        models_services.bump_data_version()
+
+        return {
+            "message": f"모델 '{deleted_model['name']}'이 성공적으로 삭제되었습니다.",
+            "model_id": model_id,
+            "deleted_at": datetime.now().isoformat()
+        }
     
     async def get_filter_options(self) -> FilterOptionsResponse:
         """
         필터 옵션 조회
         """
-        try:
-            options = await self.repository.get_filter_options()
-            return FilterOptionsResponse.model_validate(options)
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"필터 옵션 조회 중 오류가 발생했습니다: {str(e)}"
-            )
+        options = await self.repository.get_filter_options()
+        return FilterOptionsResponse.model_validate(options)
 
 
 # Singleton 인스턴스
@@ -39,14 +39,14 @@ async def get_domestic_models_excel():
     http://localhost:8000/excel/domestic
     ```
     """
-    excel_io = await excel_service.generate_domestic_excel()
+    excel_stream = await excel_service.generate_domestic_excel()
     
     # 현재 시간으로 파일명 생성
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"국내모델목록_{timestamp}.xlsx"
     
     return StreamingResponse(
-        excel_io,
+        excel_stream,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"'
@@ -81,14 +81,14 @@ async def get_global_models_excel():
     http://localhost:8000/excel/global
     ```
     """
-    excel_io = await excel_service.generate_global_excel()
+    excel_stream = await excel_service.generate_global_excel()
     
     # 현재 시간으로 파일명 생성
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"해외모델목록_{timestamp}.xlsx"
     
     return StreamingResponse(
-        excel_io,
+        excel_stream,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"'
@@ -1,242 +1,249 @@
-from io import BytesIO
 from datetime import datetime
-from typing import List
+from tempfile import SpooledTemporaryFile
+from typing import List, IO, AsyncIterator
 
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
-from fastapi import HTTPException
+import anyio.to_thread
 
+from xlsxwriter import Workbook
+from xlsxwriter.format import Format
+from xlsxwriter.worksheet import Worksheet
+
+from app.shared import TTLCache
 from app.domain.models.models_repository import models_repository
-from app.domain.models.models_schemas import ReadDomesticModel, ReadGlobalModel
+from app.domain.models.models_services import models_services
+from app.domain.models.models_schemas import GENDER_KR, KOREAN_LEVEL_KR
+
+
+# 셀 서식 (워크북마다 한 번만 등록하고 행 단위로 재사용)
+_HEADER_FORMAT = {
+    "bold": True, "font_color": "#FFFFFF", "font_size": 12, "bg_color": "#4472C4",
+    "align": "center", "valign": "vcenter", "border": 1,
+}
+_CELL_FORMAT = {"align": "left", "valign": "vcenter", "border": 1}
+
+# constant_memory: 행을 쓰는 즉시 임시 파일로 내보내 행 수와 무관하게 메모리 사용량 유지
+# 사용자 입력 문자열이 수식/하이퍼링크로 해석되지 않도록 변환 비활성화
+_WORKBOOK_OPTIONS = {
+    "constant_memory": True,
+    "strings_to_formulas": False,
+    "strings_to_urls": False,
+}
+
+# 엑셀 파일은 1MB까지 메모리에 두고 넘으면 임시 파일로 옮김, 응답은 64KB 단위로 전송
+_SPOOL_MAX_SIZE = 1_000_000
+_CHUNK_SIZE = 64 * 1024
+
+
+async def _iter_file(file: IO[bytes]) -> AsyncIterator[bytes]:
+    """
+    파일을 청크 단위로 읽어 반환 (다 읽으면 파일을 닫음)
+    - 1MB를 넘어 임시 파일로 옮겨진 경우 디스크 읽기이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+    """
+    try:
+        file.seek(0)
+        while chunk := await anyio.to_thread.run_sync(file.read, _CHUNK_SIZE):
+            yield chunk
+    finally:
+        await anyio.to_thread.run_sync(file.close)
+
+
+async def _iter_bytes(data: bytes) -> AsyncIterator[bytes]:
+    """캐시된 바이트를 청크 단위로 반환"""
+    for start in range(0, len(data), _CHUNK_SIZE):
+        yield data[start:start + _CHUNK_SIZE]
 
 
 class ExcelService:
     """엑셀 생성 서비스"""
 
-    def _create_header_style(self):
-        """헤더 스타일 생성"""
-        return {
-            'font': Font(bold=True, color="FFFFFF", size=12),
-            'fill': PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
-            'alignment': Alignment(horizontal="center", vertical="center"),
-            'border': Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-        }
-
-    def _create_cell_style(self):
-        """일반 셀 스타일 생성"""
-        return {
-            'alignment': Alignment(horizontal="left", vertical="center"),
-            'border': Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-        }
-
-    def _apply_style(self, cell, style_dict):
-        """셀에 스타일 적용"""
-        for key, value in style_dict.items():
-            setattr(cell, key, value)
-
-    async def generate_domestic_excel(self) -> BytesIO:
+    def __init__(self):
+        # (구분, 모델 데이터 버전) -> 완성된 엑셀 바이트 (전체 테이블 조회 + 생성 비용이 커서 재사용)
+        # 데이터 버전은 워커 단위라 워커가 여러 개면 다른 워커의 변경은 최대 60초 늦게 반영됨 (목록 캐시와 같은 기준)
+        # 메모리에 담기는 크기(_SPOOL_MAX_SIZE 이하)의 파일만 캐시
+        self.cache = TTLCache(ttl=60, maxsize=2)
+
+    def _create_workbook(self, file: IO[bytes], title: str,
+                         headers: List[str]) -> tuple[Workbook, Worksheet, Format]:
+        """
+        워크북 생성 (헤더 행까지 작성)
+
+        Returns:
+            (워크북, 시트, 데이터 셀 서식)
+        """
+        wb = Workbook(file, _WORKBOOK_OPTIONS)
+        header_format = wb.add_format(_HEADER_FORMAT)
+        cell_format = wb.add_format(_CELL_FORMAT)
+        ws = wb.add_worksheet(title)
+
+        ws.set_column(0, len(headers) - 1, 15)
+        ws.write_row(0, 0, headers, header_format)
+        return wb, ws, cell_format
+
+    def _stream_file(self, spool: IO[bytes], cache_key: tuple) -> AsyncIterator[bytes]:
+        """
+        저장된 엑셀 파일을 청크 스트림으로 반환
+        - 작은 파일은 메모리에만 존재하므로 그대로 캐시에 저장
+        """
+        if spool.tell() <= _SPOOL_MAX_SIZE:
+            spool.seek(0)
+            self.cache.set(cache_key, spool.read())
+        return _iter_file(spool)
+
+    def _build_domestic_xlsx(self, models_data: List) -> IO[bytes]:
+        """국내 모델 엑셀 작성 (동기 CPU 작업, 스레드 풀에서 실행)"""
+        # 헤더 정의
+        headers = [
+            "ID", "이름", "예명", "생년월일", "성별", "전화번호", "국적",
+            "소속사명", "소속사 담당자", "소속사 전화번호",
+            "인스타그램", "틱톡", "유튜브",
+            "도시", "구/군", "상세주소",
+            "특기", "기타 언어", "타투 위치", "타투 크기",
+            "키(cm)", "몸무게(kg)", "상의", "하의", "신발"
+        ]
+
+        # 1MB까지는 메모리, 넘으면 디스크에 저장
+        spool = SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+
+        # 워크북 생성 + 헤더 작성
+        wb, ws, cell_format = self._create_workbook(spool, "국내 모델 목록", headers)
+
+        # 데이터 작성 (행 단위로 기록, 검증 없이 레코드 값을 그대로 사용)
+        for row, record in enumerate(models_data, start=1):
+            data = [
+                str(record["id"]),
+                record["name"],
+                record["stage_name"] or "",
+                record["birth_date"].strftime("%Y-%m-%d") if record["birth_date"] else "",
+                GENDER_KR.get(record["gender"], ""),  # ✅ 한글 변환
+                record["phone"] or "",  # DB에는 E.164 문자열로 저장됨
+                record["nationality"] or "",
+                record["agency_name"] or "",
+                record["agency_manager_name"] or "",
+                record["agency_manager_phone"] or "",
+                record["instagram"] or "",
+                record["tictok"] or "",
+                record["youtube"] or "",
+                record["address_city"] or "",
+                record["address_district"] or "",
+                record["address_street"] or "",
+                record["special_abilities"] or "",
+                record["other_languages"] or "",
+                record["tattoo_location"] or "",
+                record["tattoo_size"] or "",
+                record["height"] if record["height"] else "",
+                record["weight"] if record["weight"] else "",
+                record["top_size"] or "",
+                record["bottom_size"] or "",
+                record["shoes_size"] or "",
+            ]
+
+            ws.write_row(row, 0, data, cell_format)
+
+        wb.close()
+        return spool
+
+    async def generate_domestic_excel(self) -> AsyncIterator[bytes]:
         """
         국내 모델 엑셀 생성
         
         Returns:
-            BytesIO: 엑셀 파일 바이트 스트림
-            
-        Raises:
-            HTTPException: 데이터 조회 또는 엑셀 생성 실패
+            AsyncIterator[bytes]: 엑셀 파일 바이트 스트림 (청크 단위)
         """
-        try:
-            # 국내 모델 데이터 조회
-            models_data = await models_repository.get_all_models_of_domestic()
-            
-            if not models_data:
-                # 데이터가 없어도 빈 엑셀 생성
-                models = []
-            else:
-                models = [ReadDomesticModel.model_validate(dict(record)) for record in models_data]
-
-            # 워크북 생성
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "국내 모델 목록"
-
-            # 헤더 정의
-            headers = [
-                "ID", "이름", "예명", "생년월일", "성별", "전화번호", "국적",
-                "소속사명", "소속사 담당자", "소속사 전화번호",
-                "인스타그램", "틱톡", "유튜브",
-                "도시", "구/군", "상세주소",
-                "특기", "기타 언어", "타투 위치", "타투 크기",
-                "키(cm)", "몸무게(kg)", "상의", "하의", "신발"
+        # 생성 시작 시점의 버전으로 키를 정함 (생성 도중 데이터가 바뀌면 이 결과는 다시 쓰이지 않음)
+        cache_key = ("domestic", models_services.data_version)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return _iter_bytes(cached)
+
+        # 국내 모델 데이터 조회 (이벤트 루프에서 대기)
+        models_data = await models_repository.get_all_models_of_domestic()
+
+        # 데이터가 없어도 빈 엑셀 생성
+        models_data = models_data or []
+
+        # 워크북 작성/저장은 순수 파이썬 CPU 작업이므로 스레드에서 실행 (다른 요청 처리 지연 방지)
+        spool = await anyio.to_thread.run_sync(self._build_domestic_xlsx, models_data)
+
+        # 청크 단위로 전송
+        return self._stream_file(spool, cache_key)
+
+    def _build_global_xlsx(self, models_data: List) -> IO[bytes]:
+        """해외 모델 엑셀 작성 (동기 CPU 작업, 스레드 풀에서 실행)"""
+        # 헤더 정의
+        headers = [
+            "ID", "이름", "예명", "생년월일", "성별", "전화번호", "국적",
+            "인스타그램", "유튜브", "카카오톡",
+            "도시", "구/군", "상세주소",
+            "특기", "모국어", "기타 언어", "한국어 수준",
+            "타투 위치", "타투 크기", "비자 타입",
+            "키(cm)", "몸무게(kg)", "상의", "하의", "신발"
+        ]
+
+        # 1MB까지는 메모리, 넘으면 디스크에 저장
+        spool = SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+
+        # 워크북 생성 + 헤더 작성
+        wb, ws, cell_format = self._create_workbook(spool, "해외 모델 목록", headers)
+
+        # 데이터 작성 (행 단위로 기록, 검증 없이 레코드 값을 그대로 사용)
+        for row, record in enumerate(models_data, start=1):
+            data = [
+                str(record["id"]),
+                record["name"],
+                record["stage_name"] or "",
+                record["birth_date"].strftime("%Y-%m-%d") if record["birth_date"] else "",
+                GENDER_KR.get(record["gender"], ""),  # ✅ 한글 변환
+                record["phone"] or "",  # DB에는 E.164 문자열로 저장됨
+                record["nationality"] or "",
+                record["instagram"] or "",
+                record["youtube"] or "",
+                record["kakaotalk"] or "",
+                record["address_city"] or "",
+                record["address_district"] or "",
+                record["address_street"] or "",
+                record["special_abilities"] or "",
+                record["first_language"] or "",
+                record["other_languages"] or "",
+                KOREAN_LEVEL_KR.get(record["korean_level"], ""),  # ✅ 한글 변환
+                record["tattoo_location"] or "",
+                record["tattoo_size"] or "",
+                record["visa_type"] or "",  # 비자 타입은 코드 그대로
+                record["height"] if record["height"] else "",
+                record["weight"] if record["weight"] else "",
+                record["top_size"] or "",
+                record["bottom_size"] or "",
+                record["shoes_size"] or "",
             ]
 
-            # 헤더 스타일
-            header_style = self._create_header_style()
-            
-            # 헤더 작성
-            for col_num, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col_num, value=header)
-                self._apply_style(cell, header_style)
-
-            # 데이터 작성
-            cell_style = self._create_cell_style()
-            
-            for row_num, model in enumerate(models, 2):
-                data = [
-                    str(model.id),
-                    model.name,
-                    model.stage_name or "",
-                    model.birth_date.strftime("%Y-%m-%d") if model.birth_date else "",
-                    model.gender.to_korean() if model.gender else "",  # ✅ 한글 변환
-                    model.phone or "",
-                    model.nationality or "",
-                    model.agency_name or "",
-                    model.agency_manager_name or "",
-                    model.agency_manager_phone or "",
-                    model.instagram or "",
-                    model.tictok or "",
-                    model.youtube or "",
-                    model.address_city or "",
-                    model.address_district or "",
-                    model.address_street or "",
-                    model.special_abilities or "",
-                    model.other_languages or "",
-                    model.tattoo_location or "",
-                    model.tattoo_size or "",
-                    model.height if model.height else "",
-                    model.weight if model.weight else "",
-                    model.top_size or "",
-                    model.bottom_size or "",
-                    model.shoes_size or "",
-                ]
-
-                for col_num, value in enumerate(data, 1):
-                    cell = ws.cell(row=row_num, column=col_num, value=value)
-                    self._apply_style(cell, cell_style)
-
-            # 열 너비 자동 조정
-            for col_num in range(1, len(headers) + 1):
-                column_letter = get_column_letter(col_num)
-                ws.column_dimensions[column_letter].width = 15
-
-            # 메모리에 저장
-            excel_io = BytesIO()
-            wb.save(excel_io)
-            excel_io.seek(0)
-
-            return excel_io
-
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"국내 모델 엑셀 생성 중 오류가 발생했습니다: {str(e)}"
-            )
-
-    async def generate_global_excel(self) -> BytesIO:
+            ws.write_row(row, 0, data, cell_format)
+
+        wb.close()
+        return spool
+
+    async def generate_global_excel(self) -> AsyncIterator[bytes]:
         """
         해외 모델 엑셀 생성
         
         Returns:
-            BytesIO: 엑셀 파일 바이트 스트림
-            
-        Raises:
-            HTTPException: 데이터 조회 또는 엑셀 생성 실패
+            AsyncIterator[bytes]: 엑셀 파일 바이트 스트림 (청크 단위)
         """
-        try:
-            # 해외 모델 데이터 조회
-            models_data = await models_repository.get_all_models_of_foreign()
-            
-            if not models_data:
-                models = []
-            else:
-                models = [ReadGlobalModel.model_validate(dict(record)) for record in models_data]
-
-            # 워크북 생성
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "해외 모델 목록"
-
-            # 헤더 정의
-            headers = [
-                "ID", "이름", "예명", "생년월일", "성별", "전화번호", "국적",
-                "인스타그램", "유튜브", "카카오톡",
-                "도시", "구/군", "상세주소",
-                "특기", "모국어", "기타 언어", "한국어 수준",
-                "타투 위치", "타투 크기", "비자 타입",
-                "키(cm)", "몸무게(kg)", "상의", "하의", "신발"
-            ]
+        # 생성 시작 시점의 버전으로 키를 정함 (생성 도중 데이터가 바뀌면 이 결과는 다시 쓰이지 않음)
+        cache_key = ("global", models_services.data_version)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return _iter_bytes(cached)
+
+        # 해외 모델 데이터 조회 (이벤트 루프에서 대기)
+        models_data = await models_repository.get_all_models_of_foreign()
+
+        # 데이터가 없어도 빈 엑셀 생성
+        models_data = models_data or []
+
+        # 워크북 작성/저장은 순수 파이썬 CPU 작업이므로 스레드에서 실행 (다른 요청 처리 지연 방지)
+        spool = await anyio.to_thread.run_sync(self._build_global_xlsx, models_data)
 
-            # 헤더 스타일
-            header_style = self._create_header_style()
-            
-            # 헤더 작성
-            for col_num, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col_num, value=header)
-                self._apply_style(cell, header_style)
-
-            # 데이터 작성
-            cell_style = self._create_cell_style()
-            
-            for row_num, model in enumerate(models, 2):
-                data = [
-                    str(model.id),
-                    model.name,
-                    model.stage_name or "",
-                    model.birth_date.strftime("%Y-%m-%d") if model.birth_date else "",
-                    model.gender.to_korean() if model.gender else "",  # ✅ 한글 변환
-                    model.phone or "",
-                    model.nationality or "",
-                    model.instagram or "",
-                    model.youtube or "",
-                    model.kakaotalk or "",
-                    model.address_city or "",
-                    model.address_district or "",
-                    model.address_street or "",
-                    model.special_abilities or "",
-                    model.first_language or "",
-                    model.other_languages or "",
-                    model.korean_level.to_korean() if model.korean_level else "",  # ✅ 한글 변환
-                    model.tattoo_location or "",
-                    model.tattoo_size or "",
-                    model.visa_type.to_korean() if model.visa_type else "",  # ✅ 한글 변환
-                    model.height if model.height else "",
-                    model.weight if model.weight else "",
-                    model.top_size or "",
-                    model.bottom_size or "",
-                    model.shoes_size or "",
-                ]
-
-                for col_num, value in enumerate(data, 1):
-                    cell = ws.cell(row=row_num, column=col_num, value=value)
-                    self._apply_style(cell, cell_style)
-
-            # 열 너비 자동 조정
-            for col_num in range(1, len(headers) + 1):
-                column_letter = get_column_letter(col_num)
-                ws.column_dimensions[column_letter].width = 15
-
-            # 메모리에 저장
-            excel_io = BytesIO()
-            wb.save(excel_io)
-            excel_io.seek(0)
-
-            return excel_io
-
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"해외 모델 엑셀 생성 중 오류가 발생했습니다: {str(e)}"
-            )
+        # 청크 단위로 전송
+        return self._stream_file(spool, cache_key)
 
 
 excel_service = ExcelService()
@@ -1,37 +1,157 @@
-from datetime import date
-from typing import Optional, List
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
 import asyncpg
 
 from app.core.base_repository import BaseRepository
 from app.core.db import db
 
+# 재방문 확인 조회 쿼리 (매 방문마다 실행되므로 커넥션 생성 시 미리 prepare)
+_DOMESTIC_BY_INFO_QUERY = (
+    "SELECT id, name, stage_name, birth_date, gender, phone, nationality, "
+    "agency_name, agency_manager_name, agency_manager_phone, "
+    "instagram, tictok, youtube, address_city, address_district, address_street, "
+    "special_abilities, other_languages, has_agency, has_tattoo, tattoo_location, tattoo_size, "
+    "height, weight, top_size, bottom_size, shoes_size "
+    "FROM models "
+    "WHERE name = $1 AND phone = $2 AND birth_date = $3 AND is_foreigner = false"
+)
+
+_FOREIGN_BY_INFO_QUERY = (
+    "SELECT id, name, stage_name, birth_date, gender, phone, nationality, "
+    "instagram, youtube, kakaotalk, address_city, address_district, address_street, "
+    "special_abilities, first_language, other_languages, korean_level, "
+    "has_tattoo, tattoo_location, tattoo_size, visa_type, "
+    "height, weight, top_size, bottom_size, shoes_size "
+    "FROM models "
+    "WHERE name = $1 AND phone = $2 AND birth_date = $3 AND is_foreigner = true"
+)
+
+db.register_statement("domestic_model_by_info", _DOMESTIC_BY_INFO_QUERY)
+db.register_statement("foreign_model_by_info", _FOREIGN_BY_INFO_QUERY)
+
+# 목록 조회 컬럼 (전체 스트리밍/페이지 조회 공통)
+_DOMESTIC_LIST_COLUMNS = (
+    "id, name, stage_name, birth_date, gender, phone, nationality, "
+    "agency_name, agency_manager_name, agency_manager_phone, "
+    "instagram, tictok, youtube, address_city, address_district, address_street, "
+    "special_abilities, other_languages, has_tattoo, tattoo_location, tattoo_size, "
+    "height, weight, top_size, bottom_size, shoes_size"
+)
+
+_FOREIGN_LIST_COLUMNS = (
+    "id, name, stage_name, birth_date, gender, phone, nationality, "
+    "instagram, youtube, kakaotalk, address_city, address_district, address_street, "
+    "special_abilities, first_language, other_languages, korean_level, "
+    "has_tattoo, tattoo_location, tattoo_size, visa_type, "
+    "height, weight, top_size, bottom_size, shoes_size"
+)
+
+# 모델 등록 컬럼 (요청 필드와 무관하게 항상 같은 SQL이 되도록 고정)
+_COMMON_CREATE_COLUMNS = (
+    "name", "stage_name", "birth_date", "gender", "phone", "nationality",
+    "instagram", "youtube", "address_city", "address_district", "address_street",
+    "special_abilities", "other_languages", "has_tattoo", "tattoo_location", "tattoo_size",
+    "height", "weight", "top_size", "bottom_size", "shoes_size",
+)
+_DOMESTIC_CREATE_COLUMNS = _COMMON_CREATE_COLUMNS + (
+    "has_agency", "agency_name", "agency_manager_name", "agency_manager_phone", "tictok",
+)
+_FOREIGN_CREATE_COLUMNS = _COMMON_CREATE_COLUMNS + (
+    "kakaotalk", "first_language", "korean_level", "visa_type",
+)
+
+
+def _create_with_camera_test_query(columns: tuple, is_foreigner: bool) -> str:
+    """
+    모델 등록 + 카메라 테스트 초기 레코드 생성 쿼리
+    - 쓰기 CTE 단일 문장이므로 명시적 트랜잭션 없이도 원자적으로 실행 (자동 커밋)
+    - is_foreigner는 쿼리에 고정, visited_at은 DB 시각(now())으로 기록
+    """
+    placeholders = ", ".join(f"${i + 1}" for i in range(len(columns)))
+    return f"""
+        WITH created AS (
+            INSERT INTO models ({", ".join(columns)}, is_foreigner)
+            VALUES ({placeholders}, {str(is_foreigner).lower()})
+            RETURNING id, name
+        ), camera_test AS (
+            INSERT INTO cameratest (model_id, is_tested, visited_at)
+            SELECT id, 'PENDING'::camerateststatusenum, now()
+            FROM created
+            ON CONFLICT DO NOTHING
+        )
+        SELECT id, name FROM created
+    """
+
+
+db.register_statement("create_domestic_model", _create_with_camera_test_query(_DOMESTIC_CREATE_COLUMNS, False))
+db.register_statement("create_foreign_model", _create_with_camera_test_query(_FOREIGN_CREATE_COLUMNS, True))
+
 
 class ModelsRepository(BaseRepository):
     """모델 Repository"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("models")
 
+    def _all_models_of_domestic_query(self) -> str:
+        return f"SELECT {_DOMESTIC_LIST_COLUMNS} FROM {self.table_name} WHERE is_foreigner = false"
+
     async def get_all_models_of_domestic(self) -> Optional[List[asyncpg.Record]]:
-        query = (
-            f"SELECT id, name, stage_name, birth_date, gender, phone, nationality, "
-            f"agency_name, agency_manager_name, agency_manager_phone, "
-            f"instagram, tictok, youtube, address_city, address_district, address_street, "
-            f"special_abilities, other_languages, has_tattoo, tattoo_location, tattoo_size, "
-            f"height, weight, top_size, bottom_size, shoes_size "
-            f"FROM {self.table_name} WHERE is_foreigner = false"
-        )
-        return await db.fetch(query)
+        return await db.fetch(self._all_models_of_domestic_query())
+
+    async def get_models_of_domestic_page(
+        self,
+        limit: int,
+        offset: int,
+        after: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[asyncpg.Record]:
+        """국내 모델 페이지 조회 (최근 등록 순, after 지정 시 해당 행 다음부터)"""
+        return await self._fetch_page(_DOMESTIC_LIST_COLUMNS, False, limit, offset, after)
+
+    def _all_models_of_foreign_query(self) -> str:
+        return f"SELECT {_FOREIGN_LIST_COLUMNS} FROM {self.table_name} WHERE is_foreigner = true"
 
     async def get_all_models_of_foreign(self) -> Optional[List[asyncpg.Record]]:
+        return await db.fetch(self._all_models_of_foreign_query())
+
+    async def get_models_of_foreign_page(
+        self,
+        limit: int,
+        offset: int,
+        after: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[asyncpg.Record]:
+        """해외 모델 페이지 조회 (최근 등록 순, after 지정 시 해당 행 다음부터)"""
+        return await self._fetch_page(_FOREIGN_LIST_COLUMNS, True, limit, offset, after)
+
+    async def _fetch_page(
+        self,
+        columns: str,
+        is_foreigner: bool,
+        limit: int,
+        offset: int,
+        after: Optional[Tuple[datetime, UUID]]
+    ) -> List[asyncpg.Record]:
+        """
+        모델 목록 페이지 조회 (created_at DESC, id DESC 순)
+        - after(직전 페이지 마지막 행의 created_at, id)가 있으면 그 뒤부터 읽음 (키셋 페이지네이션)
+          OFFSET과 달리 앞 페이지 행을 읽고 버리지 않으므로 페이지 깊이와 무관하게 일정한 비용
+        - 다음 커서를 만들 수 있도록 created_at을 함께 반환
+        - (is_foreigner, created_at DESC, id DESC) 인덱스 순서대로 읽고 LIMIT에서 종료
+        """
+        keyset = ""
+        params: list = [is_foreigner, limit, offset]
+        if after is not None:
+            keyset = "AND (created_at, id) < ($4, $5) "
+            params.extend(after)
         query = (
-            f"SELECT id, name, stage_name, birth_date, gender, phone, nationality, "
-            f"instagram, youtube, kakaotalk, address_city, address_district, address_street, "
-            f"special_abilities, first_language, other_languages, korean_level, "
-            f"has_tattoo, tattoo_location, tattoo_size, visa_type, "
-            f"height, weight, top_size, bottom_size, shoes_size "
-            f"FROM {self.table_name} WHERE is_foreigner = true"
+            f"SELECT {columns}, created_at FROM {self.table_name} "
+            f"WHERE is_foreigner = $1 {keyset}"
+            f"ORDER BY created_at DESC, id DESC LIMIT $2 OFFSET $3"
         )
-        return await db.fetch(query)
+        return await db.fetch(query, *params)
 
 
     async def get_models_physical_size(self, model_id: str) -> Optional[asyncpg.Record]:
@@ -45,28 +165,42 @@ class ModelsRepository(BaseRepository):
 
     async def get_domestic_model_by_info(self, name: str, phone: str, birth: date) -> Optional[asyncpg.Record]:
         """이름, 전화번호, 생년월일로 국내 모델 조회"""
-        query = (
-            f"SELECT id, name, stage_name, birth_date, gender, phone, nationality, "
-            f"agency_name, agency_manager_name, agency_manager_phone, "
-            f"instagram, tictok, youtube, address_city, address_district, address_street, "
-            f"special_abilities, other_languages, has_agency, has_tattoo, tattoo_location, tattoo_size, "
-            f"height, weight, top_size, bottom_size, shoes_size "
-            f"FROM {self.table_name} "
-            f"WHERE name = $1 AND phone = $2 AND birth_date = $3 AND is_foreigner = false"
-        )
-        return await db.fetchrow(query, name, phone, birth)
+        return await db.fetchrow_prepared("domestic_model_by_info", name, phone, birth)
 
     async def get_foreign_model_by_info(self, name: str, phone: str, birth: date) -> Optional[asyncpg.Record]:
         """이름, 전화번호, 생년월일로 해외 모델 조회"""
-        query = (
-            f"SELECT id, name, stage_name, birth_date, gender, phone, nationality, "
-            f"instagram, youtube, kakaotalk, address_city, address_district, address_street, "
-            f"special_abilities, first_language, other_languages, korean_level, "
-            f"has_tattoo, tattoo_location, tattoo_size, visa_type, "
-            f"height, weight, top_size, bottom_size, shoes_size "
-            f"FROM {self.table_name} "
-            f"WHERE name = $1 AND phone = $2 AND birth_date = $3 AND is_foreigner = true"
-        )
-        return await db.fetchrow(query, name, phone, birth)
+        return await db.fetchrow_prepared("foreign_model_by_info", name, phone, birth)
+
+    async def create_domestic_model(self, data: Dict[str, Any]) -> Optional[asyncpg.Record]:
+        """국내 모델 등록 + 카메라 테스트 초기 레코드 생성 (고정 컬럼 쿼리)"""
+        return await db.fetchrow_prepared("create_domestic_model", *(data[c] for c in _DOMESTIC_CREATE_COLUMNS))
+
+    async def create_foreign_model(self, data: Dict[str, Any]) -> Optional[asyncpg.Record]:
+        """해외 모델 등록 + 카메라 테스트 초기 레코드 생성 (고정 컬럼 쿼리)"""
+        return await db.fetchrow_prepared("create_foreign_model", *(data[c] for c in _FOREIGN_CREATE_COLUMNS))
+
+    async def update_model_with_camera_test(self, model_id: UUID, data: Dict[str, Any]) -> Optional[asyncpg.Record]:
+        """
+        모델 정보 수정 + 재방문 카메라 테스트 기록을 한 번의 쿼리로 처리
+        - 쓰기 CTE 단일 문장이므로 명시적 트랜잭션 없이도 원자적으로 실행 (자동 커밋)
+        - 같은 날 이미 방문 기록이 있으면 (model_id, 방문일) 유니크 인덱스 충돌 시 DO NOTHING
+        - 해당 ID의 모델이 없으면 아무것도 기록하지 않고 None 반환
+        """
+        set_clause = ", ".join(f"{key} = ${i + 2}" for i, key in enumerate(data.keys()))
+        query = f"""
+            WITH updated AS (
+                UPDATE {self.table_name}
+                SET {set_clause}
+                WHERE id = $1
+                RETURNING id
+            ), camera_test AS (
+                INSERT INTO cameratest (model_id, is_tested, visited_at)
+                SELECT id, 'PENDING'::camerateststatusenum, now()
+                FROM updated
+                ON CONFLICT DO NOTHING
+            )
+            SELECT id FROM updated
+        """
+        return await db.fetchrow(query, model_id, *data.values())
 
 models_repository = ModelsRepository()
\ No newline at end of file
@@ -1,4 +1,5 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
+from fastapi.responses import Response, StreamingResponse
 
 from app.domain.models.models_schemas import (
     ReadRevisitedModel,
@@ -9,6 +10,9 @@ from app.domain.models.models_schemas import (
 )
 from app.domain.models.models_services import models_services
 
+# 다음 페이지 커서 응답 헤더 (응답 본문은 기존처럼 모델 배열 그대로 유지)
+_NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 app = APIRouter(
     prefix="/models",
     tags=["models"],
@@ -18,22 +22,50 @@ app = APIRouter(
 @app.post("/domestic/revisit-verification")
 async def verify_domestic_revisit(request: ReadRevisitedModel):
     """국내 모델 재방문 확인"""
-    return await models_services.get_domestic_model_by_info(request)
+    content = await models_services.get_domestic_model_by_info(request)
+    return Response(content, media_type="application/json")
 
 @app.post("/global/revisit-verification")
 async def verify_global_revisit(request: ReadRevisitedModel):
     """해외 모델 재방문 확인"""
-    return await models_services.get_foreign_model_by_info(request)
+    content = await models_services.get_foreign_model_by_info(request)
+    return Response(content, media_type="application/json")
 
 @app.get("/domestic")
-async def read_domestic():
-    """국내 모델 목록 조회"""
-    return await models_services.get_all_models_of_domestic()
+async def read_domestic(
+    limit: int | None = Query(None, ge=1, le=1000, description="페이지 크기 (미지정 시 전체 조회)"),
+    offset: int = Query(0, ge=0, description="건너뛸 개수"),
+    after: str | None = Query(None, description="다음 페이지 커서 (직전 응답의 X-Next-Cursor 헤더 값, limit와 함께 사용)"),
+):
+    """
+    국내 모델 목록 조회
+    - limit 미지정 시 전체를 커서 기반 스트리밍
+    - limit 지정 시 페이지 조회, 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서 반환
+      (offset 대신 after=커서로 이어 읽으면 페이지 깊이와 무관하게 일정한 비용)
+    """
+    if limit is None:
+        return StreamingResponse(await models_services.stream_all_models_of_domestic(), media_type="application/json")
+    content, next_cursor = await models_services.get_models_of_domestic_page(limit, offset, after)
+    headers = {_NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return Response(content, media_type="application/json", headers=headers)
 
 @app.get("/global")
-async def read_global():
-    """해외 모델 목록 조회"""
-    return await models_services.get_all_models_of_foreign()
+async def read_global(
+    limit: int | None = Query(None, ge=1, le=1000, description="페이지 크기 (미지정 시 전체 조회)"),
+    offset: int = Query(0, ge=0, description="건너뛸 개수"),
+    after: str | None = Query(None, description="다음 페이지 커서 (직전 응답의 X-Next-Cursor 헤더 값, limit와 함께 사용)"),
+):
+    """
+    해외 모델 목록 조회
+    - limit 미지정 시 전체를 커서 기반 스트리밍
+    - limit 지정 시 페이지 조회, 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서 반환
+      (offset 대신 after=커서로 이어 읽으면 페이지 깊이와 무관하게 일정한 비용)
+    """
+    if limit is None:
+        return StreamingResponse(await models_services.stream_all_models_of_foreign(), media_type="application/json")
+    content, next_cursor = await models_services.get_models_of_foreign_page(limit, offset, after)
+    headers = {_NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return Response(content, media_type="application/json", headers=headers)
 
 @app.post("/domestic")
 async def create_domestic(request: CreateDomesticModel):
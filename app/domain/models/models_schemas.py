@@ -1,85 +1,42 @@
 from datetime import date
-from enum import Enum
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from app.shared import ValidatedPhoneNumber, ValidatedPhoneNumberOptional
 
 
-class Gender(str, Enum):
-    MALE = "MALE"
-    FEMALE = "FEMALE"
-    OTHERS = "OTHERS"
-
-    def to_korean(self) -> str:
-        """한글 변환"""
-        mapping = {
-            "MALE": "남성",
-            "FEMALE": "여성",
-            "OTHERS": "기타"
-        }
-        return mapping.get(self.value, self.value)
-
-class KoreanLevel(str, Enum):
-    BAD = "BAD"
-    NOT_BAD = "NOT_BAD"
-    GOOD = "GOOD"
-    VERY_GOOD = "VERY_GOOD"
-
-    def to_korean(self) -> str:
-        """한글 변환"""
-        mapping = {
-            "BAD": "낮음",
-            "NOT_BAD": "보통",
-            "GOOD": "좋음",
-            "VERY_GOOD": "매우 좋음"
-        }
-        return mapping.get(self.value, self.value)
-
-class VisaType(str, Enum):
-    C1 = "C1"
-    C2 = "C2"
-    C3 = "C3"
-    C4 = "C4"
-    E1 = "E1"
-    E2 = "E2"
-    E3 = "E3"
-    E4 = "E4"
-    E5 = "E5"
-    E6 = "E6"
-    E7 = "E7"
-    E8 = "E8"
-    E9 = "E9"
-    E10 = "E10"
-    F1 = "F1"
-    F2 = "F2"
-    F3 = "F3"
-    F4 = "F4"
-    F5 = "F5"
-    F6 = "F6"
-    H1 = "H1"
-    H2 = "H2"
-    D1 = "D1"
-    D2 = "D2"
-    D3 = "D3"
-    D4 = "D4"
-    D5 = "D5"
-    D6 = "D6"
-    D7 = "D7"
-    D8 = "D8"
-    D9 = "D9"
-    D10 = "D10"
-    A1 = "A1"
-    A2 = "A2"
-    A3 = "A3"
-    B1 = "B1"
-    B2 = "B2"
-
-    def to_korean(self) -> str:
-        """한글 변환 (비자 타입은 코드 그대로 반환)"""
-        # 비자 타입은 국제적으로 통용되는 코드이므로 그대로 사용
-        return self.value
+# 선택 값 타입 (Literal: 검증 시 Enum 변환 없이 문자열 그대로 사용, DB에도 문자열로 전달)
+Gender = Literal["MALE", "FEMALE", "OTHERS"]
+
+KoreanLevel = Literal["BAD", "NOT_BAD", "GOOD", "VERY_GOOD"]
+
+# 비자 타입은 국제적으로 통용되는 코드이므로 한글 변환 없이 그대로 사용
+VisaType = Literal[
+    "C1", "C2", "C3", "C4",
+    "E1", "E2", "E3", "E4", "E5", "E6", "E7", "E8", "E9", "E10",
+    "F1", "F2", "F3", "F4", "F5", "F6",
+    "H1", "H2",
+    "D1", "D2", "D3", "D4", "D5", "D6", "D7", "D8", "D9", "D10",
+    "A1", "A2", "A3",
+    "B1", "B2",
+]
+
+# 값 -> 한글 표기
+GENDER_KR: dict[str, str] = {
+    "MALE": "남성",
+    "FEMALE": "여성",
+    "OTHERS": "기타",
+}
+
+KOREAN_LEVEL_KR: dict[str, str] = {
+    "BAD": "낮음",
+    "NOT_BAD": "보통",
+    "GOOD": "좋음",
+    "VERY_GOOD": "매우 좋음",
+}
+
 
 class ModelBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
@@ -115,7 +72,8 @@ class CreateDomesticModel(ModelBase):
     has_agency: bool = Field(default=False)
     #has_agency가 True일 경우 agency_name은 필수로 들어가야 함
     agency_name: str | None = Field(None, max_length=100)
-    agency_manager_name: str | None = Field(None, max_length=100)
+    # 담당자 이름은 1~3글자 (길이 검증은 pydantic-core에서 처리, 빈 문자열은 미입력으로 허용)
+    agency_manager_name: str | None = Field(None, max_length=3)
     agency_manager_phone: ValidatedPhoneNumberOptional = Field(None)
     tictok: str | None = Field(None, max_length=100)
 
@@ -123,8 +81,6 @@ class CreateDomesticModel(ModelBase):
     def _validate_agency(self):
         if self.has_agency and not self.agency_name:
             raise ValueError('소속사가 있는 경우 소속사명은 필수입니다.')
-        if self.agency_manager_name and len(self.agency_manager_name) not in (1, 2, 3):
-            raise ValueError('담당자 이름은 1~3글자 이어야합니다.')
         return self
 
 class CreateGlobalModel(ModelBase):
@@ -134,13 +90,28 @@ class CreateGlobalModel(ModelBase):
     visa_type: VisaType = Field(...)
 
 class ReadDomesticModel(CreateDomesticModel):
+    # frozen: 목록/검색 캐시에 담긴 인스턴스를 여러 요청이 공유하므로 변경 불가로 둠
+    model_config = ConfigDict(frozen=True)
+
     id: UUID = Field(...)
+    # 등록 시에는 1~3글자지만 수정(UpdateDomesticModel)에서는 100자까지 저장되므로 조회는 수정 스키마와 같은 길이 허용
+    agency_manager_name: str | None = Field(None, max_length=100)
 
 
 class ReadGlobalModel(CreateGlobalModel):
+    model_config = ConfigDict(frozen=True)
+
     id: UUID = Field(...)
 
-class UpdateDomesticModel(BaseModel):
+def _reject_null(v):
+    """수정 요청에서 필수 컬럼에 명시적으로 보낸 null 거부 (보내지 않은 필드는 검증하지 않음)"""
+    if v is None:
+        raise ValueError('필수 항목은 null로 수정할 수 없습니다.')
+    return v
+
+
+class UpdateModelBase(BaseModel):
+    """국내/해외 수정 스키마 공통 필드"""
     id: UUID = Field(...)
     name: str | None = Field(None, min_length=1, max_length=100)
     stage_name: str | None = Field(None, max_length=100)
@@ -164,43 +135,34 @@ class UpdateDomesticModel(BaseModel):
     bottom_size: str | None = Field(None, max_length=10)
     shoes_size: str | None = Field(None, max_length=10)
     is_foreigner: bool | None = None
+
+    # null은 선택 항목만 비움 (필수 항목이 NULL로 저장되면 조회/검색/엑셀 검증이 실패함)
+    _not_null = field_validator(
+        'name', 'birth_date', 'gender', 'phone', 'has_tattoo', 'height', 'is_foreigner'
+    )(_reject_null)
+
+
+class UpdateDomesticModel(UpdateModelBase):
     has_agency: bool | None = None
     agency_name: str | None = Field(None, max_length=100)
     agency_manager_name: str | None = Field(None, max_length=100)
     agency_manager_phone: ValidatedPhoneNumberOptional = Field(None)
     tictok: str | None = Field(None, max_length=100)
 
+    _not_null_domestic = field_validator('has_agency')(_reject_null)
 
-class UpdateGlobalModel(BaseModel):
-    id: UUID = Field(...)
-    name: str | None = Field(None, min_length=1, max_length=100)
-    stage_name: str | None = Field(None, max_length=100)
-    birth_date: date | None = None
-    gender: Gender | None = None
-    phone: ValidatedPhoneNumberOptional = Field(None)
-    nationality: str | None = Field(None, max_length=50)
-    instagram: str | None = Field(None, max_length=100)
-    youtube: str | None = Field(None, max_length=100)
-    address_city: str | None = Field(None, max_length=50)
-    address_district: str | None = Field(None, max_length=50)
-    address_street: str | None = Field(None, max_length=200)
-    special_abilities: str | None = Field(None, max_length=500)
-    other_languages: str | None = Field(None, max_length=200)
-    has_tattoo: bool | None = None
-    tattoo_location: str | None = Field(None, max_length=100)
-    tattoo_size: str | None = Field(None, max_length=50)
-    height: float | None = Field(None, gt=0, le=300)
-    weight: float | None = Field(None, gt=0, le=500)
-    top_size: str | None = Field(None, max_length=10)
-    bottom_size: str | None = Field(None, max_length=10)
-    shoes_size: str | None = Field(None, max_length=10)
-    is_foreigner: bool | None = None
+
+class UpdateGlobalModel(UpdateModelBase):
     kakaotalk: str | None = Field(None, max_length=100)
     first_language: str | None = Field(None, max_length=50)
     korean_level: KoreanLevel | None = None
     visa_type: VisaType | None = None
 
+    _not_null_global = field_validator('korean_level', 'visa_type')(_reject_null)
+
 class DeleteModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: UUID = Field(...)
 
 
@@ -214,4 +176,6 @@ class ReadRevisitedModel(BaseModel):
     birth: date = Field(...)
 
 class GetModelId(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: UUID = Field(...)
\ No newline at end of file
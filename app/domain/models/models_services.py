@@ -1,15 +1,123 @@
+import base64
+import json
 from datetime import date, datetime
-from typing import List, Optional
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+from uuid import UUID
 
+import asyncpg
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 
-from app.core.db import db
+from app.shared import TTLCache
 from app.shared.validators import serialize_phone
 from app.domain.models.models_repository import models_repository
 from app.domain.models.models_schemas import (ReadDomesticModel, ReadGlobalModel, CreateDomesticModel,
-                                              CreateGlobalModel, UpdateDomesticModel, ModelResponse, UpdateGlobalModel,
-                                              ReadRevisitedModel)
-from app.domain.admins.admins_repository import admins_repository
+                                              CreateGlobalModel, UpdateModelBase, UpdateDomesticModel, ModelResponse,
+                                              UpdateGlobalModel, ReadRevisitedModel)
+
+
+# 목록 검증/직렬화기 (행마다 model_validate/model_dump_json 하지 않고 묶음 단위로 한 번에 처리)
+_DOMESTIC_LIST_ADAPTER = TypeAdapter(List[ReadDomesticModel])
+_GLOBAL_LIST_ADAPTER = TypeAdapter(List[ReadGlobalModel])
+# 단건 검증/직렬화기 (검증 후 JSON 바이트로 바로 반환, FastAPI의 jsonable_encoder 변환 생략)
+_DOMESTIC_ADAPTER = TypeAdapter(ReadDomesticModel)
+_GLOBAL_ADAPTER = TypeAdapter(ReadGlobalModel)
+
+# 등록 데이터 -> DB 컬럼 dict 변환기 (model_dump 대신 직렬화 함수를 직접 호출)
+_CREATE_DOMESTIC_DUMP = TypeAdapter(CreateDomesticModel).dump_python
+_CREATE_GLOBAL_DUMP = TypeAdapter(CreateGlobalModel).dump_python
+# 등록 시 DB에서 채우는 필드
+_CREATE_EXCLUDE = {'id', 'is_foreigner', 'created_at', 'updated_at'}
+
+# 응답 메시지 템플릿
+_CREATE_MESSAGE = "%s 님의 접수가 성공적으로 완료되었습니다."
+_UPDATE_MESSAGE = "%s 님의 정보가 성공적으로 수정되었습니다. 재방문을 환영합니다."
+
+# 전체 목록 스트리밍 시 한 번에 조회/직렬화하는 행 수 (묶음마다 키셋 쿼리 한 번)
+_STREAM_BATCH_SIZE = 500
+
+# 목록 응답 캐시에 담을 최대 크기 (넘으면 스트리밍만 하고 캐시하지 않음)
+_LIST_CACHE_MAX_BYTES = 5_000_000
+
+
+def _update_columns(update_data: UpdateModelBase) -> dict:
+    """
+    수정 요청에서 보낸 필드만 컬럼 dict로 변환
+    - model_dump(exclude_unset=True)의 직렬화 경로 대신 model_fields_set에서 값을 바로 꺼냄
+    - 모든 필드가 DB에 그대로 넘길 수 있는 스칼라 값이고, 전화번호만 호출부에서 E.164로 변환
+    - 컬럼 순서를 고정해 같은 필드 조합이면 같은 SQL이 되도록 함 (asyncpg statement 캐시 재사용)
+    """
+    return {key: getattr(update_data, key) for key in sorted(update_data.model_fields_set) if key != 'id'}
+
+
+async def _iter_pages(
+    fetch_page: Callable[[int, int, Optional[Tuple[datetime, UUID]]], Awaitable[List[asyncpg.Record]]]
+) -> AsyncIterator[List[asyncpg.Record]]:
+    """
+    전체 목록을 키셋 페이지 단위로 조회 (created_at DESC, id DESC 순)
+    - 묶음마다 커넥션을 받아 조회 후 바로 반납하므로, 느린 클라이언트에게 전송하는 동안 커넥션/트랜잭션을 붙잡지 않음
+    """
+    after = None
+    while True:
+        records = await fetch_page(_STREAM_BATCH_SIZE, 0, after)
+        if records:
+            yield records
+        if len(records) < _STREAM_BATCH_SIZE:
+            return
+        last = records[-1]
+        after = (last["created_at"], last["id"])
+
+
+async def _json_array_stream(
+    first: bytes,
+    pages: AsyncIterator[List[asyncpg.Record]],
+    adapter: TypeAdapter
+) -> AsyncIterator[bytes]:
+    """이미 직렬화된 첫 묶음(JSON 배열) 뒤에 나머지 묶음을 검증/직렬화하여 이어 붙인 JSON 배열 조각으로 반환"""
+    # _json_array 결과 "[...]"에서 대괄호를 떼고 이어 붙임
+    yield first[:-1]
+    async for records in pages:
+        yield b"," + _json_array(records, adapter)[1:-1]
+    yield b"]"
+
+
+async def _iter_chunk(data: bytes) -> AsyncIterator[bytes]:
+    """완성된 바이트를 한 조각 스트림으로 반환"""
+    yield data
+
+
+def _json_array(records: List[asyncpg.Record], adapter: TypeAdapter) -> bytes:
+    """레코드 목록을 한 번에 검증/직렬화하여 JSON 배열로 반환"""
+    if not records:
+        return b"[]"
+    columns = tuple(records[0].keys())
+    return adapter.dump_json(adapter.validate_python([dict(zip(columns, record)) for record in records]))
+
+
+def _next_cursor(records: List[asyncpg.Record], limit: int) -> Optional[str]:
+    """
+    다음 페이지 커서 생성 (마지막 행의 created_at, id를 URL-safe base64로 인코딩)
+    - 페이지가 가득 차지 않았으면 마지막 페이지이므로 None
+    """
+    if len(records) < limit:
+        return None
+    last = records[-1]
+    payload = json.dumps([last["created_at"].isoformat(), str(last["id"])], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, UUID]]:
+    """다음 페이지 커서 해석 (형식이 잘못되면 400)"""
+    if cursor is None:
+        return None
+    try:
+        created_at, model_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), UUID(model_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=400,
+            detail="유효하지 않은 페이지 커서입니다."
+        )
 
 
 class ModelsServices:
@@ -17,245 +125,237 @@ class ModelsServices:
 
     def __init__(self, repository):
         self.repository = repository
+        # 모델 데이터 버전 (등록/수정/삭제마다 증가)
+        # 모델 데이터에서 만든 캐시(목록, 관리자 검색, 엑셀)는 이 값을 키에 포함해 변경 즉시 무효화
+        # 버전과 캐시 모두 워커 프로세스 단위라 즉시 무효화는 변경을 처리한 워커에서만 보장됨
+        # 워커가 여러 개면 다른 워커는 각 캐시의 TTL(목록/엑셀 60초, 관리자 검색 15초)만큼 이전 데이터를 응답할 수 있음
+        self.data_version = 0
+        # (구분, 데이터 버전) -> 완성된 목록 JSON 바이트 (최대 60초)
+        self.list_cache = TTLCache(ttl=60, maxsize=2)
 
+    def bump_data_version(self) -> None:
+        """모델 데이터 변경 후 호출 (이전 버전으로 만든 캐시는 더 이상 조회되지 않음)"""
+        self.data_version += 1
+        self.list_cache.clear()
 
-    async def get_all_models_of_domestic(self) -> List[ReadDomesticModel]:
-        """모든 국내 모델 조회"""
-        try:
-            model_data = await self.repository.get_all_models_of_domestic()
-            
-            if not model_data:
-                return []
-            
-            return [
-                ReadDomesticModel.model_validate(dict(record))
-                for record in model_data
-            ]
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"국내 모델 목록 조회 중 오류가 발생했습니다: {str(e)}"
-            )
+    async def _open_list_stream(
+        self,
+        kind: str,
+        fetch_page: Callable[[int, int, Optional[Tuple[datetime, UUID]]], Awaitable[List[asyncpg.Record]]],
+        adapter: TypeAdapter
+    ) -> AsyncIterator[bytes]:
+        """
+        목록 JSON 스트림 준비 (캐시 적중 시 DB 조회/검증 없이 바로 반환)
+        - 첫 묶음은 응답(200, 헤더) 전송 전에 조회/검증/직렬화하므로, 실패하면 잘린 배열 대신 오류 응답이 나감
+        - 첫 묶음에 전체가 담기면 스트리밍 없이 바로 캐시
+        """
+        # 조회 시작 시점의 버전으로 키를 정함 (조회 도중 변경되면 이 결과는 다시 쓰이지 않음)
+        cache_key = (kind, self.data_version)
+        cached = self.list_cache.get(cache_key)
+        if cached is not None:
+            return _iter_chunk(cached)
 
-    async def get_all_models_of_foreign(self) -> List[ReadGlobalModel]:
-        """모든 해외 모델 조회"""
-        try:
-            model_data = await self.repository.get_all_models_of_foreign()
-            
-            if not model_data:
-                return []
-            
-            return [
-                ReadGlobalModel.model_validate(dict(record))
-                for record in model_data
-            ]
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"해외 모델 목록 조회 중 오류가 발생했습니다: {str(e)}"
-            )
+        pages = _iter_pages(fetch_page)
+        records = await anext(pages, [])
+        first = _json_array(records, adapter)
+        if len(records) < _STREAM_BATCH_SIZE:
+            await pages.aclose()
+            self.list_cache.set(cache_key, first)
+            return _iter_chunk(first)
+        return self._stream_and_cache(cache_key, _json_array_stream(first, pages, adapter))
 
-    async def get_domestic_model_by_info(self, model_info: ReadRevisitedModel) -> ReadDomesticModel:
-        """이름, 전화번호, 생년월일로 국내 모델 조회"""
-        try:
-            # PhoneNumber 객체를 E.164 문자열로 변환
-            phone_str = serialize_phone(model_info.phone, "E164")
-            
-            result = await self.repository.get_domestic_model_by_info(
-                model_info.name, 
-                phone_str, 
-                model_info.birth
-            )
-            
-            if not result:
-                raise HTTPException(
-                    status_code=404,
-                    detail="등록된 모델이 존재하지 않습니다."
-                )
-            
-            return ReadDomesticModel.model_validate(dict(result))
-        except HTTPException:
-            raise
-        except Exception as e:
+    async def _stream_and_cache(self, cache_key: tuple, stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """목록 JSON 조각을 전송하면서 모아 두었다가, 끝까지 전송되고 크기 제한 이내면 캐시"""
+        chunks = []
+        size = 0
+        async for chunk in stream:
+            yield chunk
+            if chunks is not None:
+                size += len(chunk)
+                if size <= _LIST_CACHE_MAX_BYTES:
+                    chunks.append(chunk)
+                else:
+                    chunks = None
+
+        # 끝까지 전송된 경우만 캐시
+        if chunks is not None:
+            self.list_cache.set(cache_key, b"".join(chunks))
+
+    async def stream_all_models_of_domestic(self) -> AsyncIterator[bytes]:
+        """모든 국내 모델 조회 (첫 묶음 검증 후 JSON 배열을 페이지 묶음 단위로 스트리밍)"""
+        return await self._open_list_stream(
+            "domestic", self.repository.get_models_of_domestic_page, _DOMESTIC_LIST_ADAPTER
+        )
+
+    async def stream_all_models_of_foreign(self) -> AsyncIterator[bytes]:
+        """모든 해외 모델 조회 (첫 묶음 검증 후 JSON 배열을 페이지 묶음 단위로 스트리밍)"""
+        return await self._open_list_stream(
+            "global", self.repository.get_models_of_foreign_page, _GLOBAL_LIST_ADAPTER
+        )
+
+    async def get_models_of_domestic_page(
+        self,
+        limit: int,
+        offset: int,
+        after: Optional[str] = None
+    ) -> Tuple[bytes, Optional[str]]:
+        """국내 모델 목록 한 페이지 조회 (JSON 바이트, 다음 페이지 커서)"""
+        records = await self.repository.get_models_of_domestic_page(limit, offset, _decode_cursor(after))
+        return _json_array(records, _DOMESTIC_LIST_ADAPTER), _next_cursor(records, limit)
+
+    async def get_models_of_foreign_page(
+        self,
+        limit: int,
+        offset: int,
+        after: Optional[str] = None
+    ) -> Tuple[bytes, Optional[str]]:
+        """해외 모델 목록 한 페이지 조회 (JSON 바이트, 다음 페이지 커서)"""
+        records = await self.repository.get_models_of_foreign_page(limit, offset, _decode_cursor(after))
+        return _json_array(records, _GLOBAL_LIST_ADAPTER), _next_cursor(records, limit)
+
+    async def get_domestic_model_by_info(self, model_info: ReadRevisitedModel) -> bytes:
+        """이름, 전화번호, 생년월일로 국내 모델 조회 (JSON 바이트)"""
+        # PhoneNumber 객체를 E.164 문자열로 변환
+        phone_str = serialize_phone(model_info.phone, "E164")
+        
+        result = await self.repository.get_domestic_model_by_info(
+            model_info.name, 
+            phone_str, 
+            model_info.birth
+        )
+        
+        if not result:
             raise HTTPException(
-                status_code=500,
-                detail=f"국내 모델 조회 중 오류가 발생했습니다: {str(e)}"
+                status_code=404,
+                detail="등록된 모델이 존재하지 않습니다."
             )
+        
+        return _DOMESTIC_ADAPTER.dump_json(_DOMESTIC_ADAPTER.validate_python(dict(result)))
 
-    async def get_foreign_model_by_info(self, model_info: ReadRevisitedModel) -> ReadGlobalModel:
-        """이름, 전화번호, 생년월일로 해외 모델 조회"""
-        try:
-            # PhoneNumber 객체를 E.164 문자열로 변환
-            phone_str = serialize_phone(model_info.phone, "E164")
-            
-            result = await self.repository.get_foreign_model_by_info(
-                model_info.name,
-                phone_str,
-                model_info.birth
-            )
-            
-            if not result:
-                raise HTTPException(
-                    status_code=404,
-                    detail="등록된 모델이 존재하지 않습니다."
-                )
-            
-            return ReadGlobalModel.model_validate(dict(result))
-        except HTTPException:
-            raise
-        except Exception as e:
+    async def get_foreign_model_by_info(self, model_info: ReadRevisitedModel) -> bytes:
+        """이름, 전화번호, 생년월일로 해외 모델 조회 (JSON 바이트)"""
+        # PhoneNumber 객체를 E.164 문자열로 변환
+        phone_str = serialize_phone(model_info.phone, "E164")
+        
+        result = await self.repository.get_foreign_model_by_info(
+            model_info.name,
+            phone_str,
+            model_info.birth
+        )
+        
+        if not result:
             raise HTTPException(
-                status_code=500,
-                detail=f"해외 모델 조회 중 오류가 발생했습니다: {str(e)}"
+                status_code=404,
+                detail="등록된 모델이 존재하지 않습니다."
             )
+        
+        return _GLOBAL_ADAPTER.dump_json(_GLOBAL_ADAPTER.validate_python(dict(result)))
 
 
     async def create_domestic_model(self, create_data: CreateDomesticModel) -> ModelResponse:
         """국내 모델 등록"""
-        try:
-            async with db.transaction() as conn:
-                # exclude_unset: 프론트엔드에서 보내지 않은 필드 제외
-                # exclude_none: None 값 제외 (DB 기본값 사용)
-                data_dict = create_data.model_dump(
-                    exclude_unset=True,
-                    exclude_none=True, 
-                    exclude={'id', 'is_foreigner', 'created_at', 'updated_at'}
-                )
-                data_dict['is_foreigner'] = False
-                # 전화번호를 E.164 형식으로 일관 저장
-                if 'phone' in data_dict and create_data.phone is not None:
-                    data_dict['phone'] = serialize_phone(create_data.phone, "E164")
-                if 'agency_manager_phone' in data_dict and create_data.agency_manager_phone is not None:
-                    data_dict['agency_manager_phone'] = serialize_phone(create_data.agency_manager_phone, "E164")
-                
-                # 1) 모델 생성
-                created = await self.repository.create_transaction(conn, data_dict)
-                # 2) 카메라 테스트 초기 레코드 생성 (동일 트랜잭션)
-                if created and created.get('id'):
-                    await admins_repository.create_camera_test_transaction(
-                        conn=conn,
-                        model_id=created['id'],
-                        visited_at=datetime.now()
-                    )
-                
-                return ModelResponse(
-                    name=data_dict['name'], 
-                    message=f"{data_dict['name']} 님의 접수가 성공적으로 완료되었습니다."
-                )
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"국내 모델 등록 중 오류가 발생했습니다: {str(e)}"
-            )
+        # 모든 등록 컬럼을 채움 (보내지 않은 필드는 스키마 기본값, is_foreigner는 쿼리에 고정)
+        data_dict = _CREATE_DOMESTIC_DUMP(
+            create_data,
+            exclude=_CREATE_EXCLUDE,
+        )
+        # 전화번호를 E.164 형식으로 일관 저장
+        if 'phone' in data_dict and create_data.phone is not None:
+            data_dict['phone'] = serialize_phone(create_data.phone, "E164")
+        if 'agency_manager_phone' in data_dict and create_data.agency_manager_phone is not None:
+            data_dict['agency_manager_phone'] = serialize_phone(create_data.agency_manager_phone, "E164")
+
+        # 모델 생성 + 카메라 테스트 초기 레코드 생성 (단일 CTE 쿼리)
+        await self.repository.create_domestic_model(data_dict)
+
+        # 커밋 후 모델 데이터 캐시 무효화
+        self.bump_data_version()
+
+        # 서버에서 만든 값이므로 검증 없이 생성
+        name = data_dict['name']
+        return ModelResponse.model_construct(name=name, message=_CREATE_MESSAGE % name)
 
     async def create_foreign_model(self, create_data: CreateGlobalModel) -> ModelResponse:
         """해외 모델 등록"""
-        try:
-            async with db.transaction() as conn:
-                # exclude_unset: 프론트엔드에서 보내지 않은 필드 제외
-                # exclude_none: None 값 제외 (DB 기본값 사용)
-                data_dict = create_data.model_dump(
-                    exclude_unset=True,
-                    exclude_none=True, 
-                    exclude={'id', 'is_foreigner', 'created_at', 'updated_at'}
-                )
-                data_dict['is_foreigner'] = True
-                # 전화번호를 E.164 형식으로 일관 저장
-                if 'phone' in data_dict and create_data.phone is not None:
-                    data_dict['phone'] = serialize_phone(create_data.phone, "E164")
-                
-                # 1) 모델 생성
-                created = await self.repository.create_transaction(conn, data_dict)
-                # 2) 카메라 테스트 초기 레코드 생성 (동일 트랜잭션)
-                if created and created.get('id'):
-                    await admins_repository.create_camera_test_transaction(
-                        conn=conn,
-                        model_id=created['id'],
-                        visited_at=datetime.now()
-                    )
-                
-                return ModelResponse(
-                    name=data_dict['name'], 
-                    message=f"{data_dict['name']} 님의 접수가 성공적으로 완료되었습니다."
-                )
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"해외 모델 등록 중 오류가 발생했습니다: {str(e)}"
-            )
+        # 모든 등록 컬럼을 채움 (보내지 않은 필드는 스키마 기본값, is_foreigner는 쿼리에 고정)
+        data_dict = _CREATE_GLOBAL_DUMP(
+            create_data,
+            exclude=_CREATE_EXCLUDE,
+        )
+        # 전화번호를 E.164 형식으로 일관 저장
+        if 'phone' in data_dict and create_data.phone is not None:
+            data_dict['phone'] = serialize_phone(create_data.phone, "E164")
+
+        # 모델 생성 + 카메라 테스트 초기 레코드 생성 (단일 CTE 쿼리)
+        await self.repository.create_foreign_model(data_dict)
+
+        # 커밋 후 모델 데이터 캐시 무효화
+        self.bump_data_version()
+
+        # 서버에서 만든 값이므로 검증 없이 생성
+        name = data_dict['name']
+        return ModelResponse.model_construct(name=name, message=_CREATE_MESSAGE % name)
 
 
     async def update_domestic_model(self, update_data: UpdateDomesticModel) -> ModelResponse:
         """국내 모델 정보 수정"""
-        try:
-            data_dict = update_data.model_dump(exclude_none=True, exclude={'id'})
-            # 전화번호를 E.164 형식으로 일관 저장
-            if 'phone' in data_dict and update_data.phone is not None:
-                data_dict['phone'] = serialize_phone(update_data.phone, "E164")
-            if 'agency_manager_phone' in data_dict and update_data.agency_manager_phone is not None:
-                data_dict['agency_manager_phone'] = serialize_phone(update_data.agency_manager_phone, "E164")
-
-            if not data_dict:
-                raise HTTPException(
-                    status_code=400,
-                    detail="수정할 데이터가 없습니다."
-                )
-
-            async with db.transaction() as conn:
-                await self.repository.update_transaction(conn, record_id=update_data.id, data=data_dict)
-                # 방문 기록 남기기 (동일 트랜잭션): PENDING 상태의 cameratest 추가
-                await admins_repository.create_camera_test_transaction(
-                    conn=conn,
-                    model_id=update_data.id,
-                    visited_at=datetime.now()
-                )
-            
-            return ModelResponse(
-                name=data_dict.get('name', '모델'),
-                message=f"{data_dict.get('name', '모델')} 님의 정보가 성공적으로 수정되었습니다. 재방문을 환영합니다."
+        # 요청에 포함된 필드만 수정 (명시적으로 보낸 null은 NULL로 반영)
+        data_dict = _update_columns(update_data)
+        # 전화번호를 E.164 형식으로 일관 저장
+        if 'phone' in data_dict and update_data.phone is not None:
+            data_dict['phone'] = serialize_phone(update_data.phone, "E164")
+        if 'agency_manager_phone' in data_dict and update_data.agency_manager_phone is not None:
+            data_dict['agency_manager_phone'] = serialize_phone(update_data.agency_manager_phone, "E164")
+
+        if not data_dict:
+            raise HTTPException(
+                status_code=400,
+                detail="수정할 데이터가 없습니다."
             )
-        except HTTPException:
-            raise
-        except Exception as e:
+
+        # 모델 수정 + 방문 기록(PENDING 상태의 cameratest) 추가 (단일 CTE 쿼리)
+        updated = await self.repository.update_model_with_camera_test(update_data.id, data_dict)
+        if not updated:
             raise HTTPException(
-                status_code=500,
-                detail=f"국내 모델 정보 수정 중 오류가 발생했습니다: {str(e)}"
+                status_code=404,
+                detail="등록된 모델이 존재하지 않습니다."
             )
 
+        # 커밋 후 모델 데이터 캐시 무효화
+        self.bump_data_version()
+
+        # 서버에서 만든 값이므로 검증 없이 생성
+        name = data_dict.get('name') or '모델'
+        return ModelResponse.model_construct(name=name, message=_UPDATE_MESSAGE % name)
+
     async def update_foreign_model(self, update_data: UpdateGlobalModel) -> ModelResponse:
         """해외 모델 정보 수정"""
-        try:
-            data_dict = update_data.model_dump(exclude_none=True, exclude={'id'})
-            # 전화번호를 E.164 형식으로 일관 저장
-            if 'phone' in data_dict and update_data.phone is not None:
-                data_dict['phone'] = serialize_phone(update_data.phone, "E164")
-
-            if not data_dict:
-                raise HTTPException(
-                    status_code=400,
-                    detail="수정할 데이터가 없습니다."
-                )
-
-            async with db.transaction() as conn:
-                await self.repository.update_transaction(conn, record_id=update_data.id, data=data_dict)
-                # 방문 기록 남기기 (동일 트랜잭션): PENDING 상태의 cameratest 추가
-                await admins_repository.create_camera_test_transaction(
-                    conn=conn,
-                    model_id=update_data.id,
-                    visited_at=datetime.now()
-                )
-            
-            return ModelResponse(
-                name=data_dict.get('name', '모델'),
-                message=f"{data_dict.get('name', '모델')} 님의 정보가 성공적으로 수정되었습니다. 재방문을 환영합니다."
+        # 요청에 포함된 필드만 수정 (명시적으로 보낸 null은 NULL로 반영)
+        data_dict = _update_columns(update_data)
+        # 전화번호를 E.164 형식으로 일관 저장
+        if 'phone' in data_dict and update_data.phone is not None:
+            data_dict['phone'] = serialize_phone(update_data.phone, "E164")
+
+        if not data_dict:
+            raise HTTPException(
+                status_code=400,
+                detail="수정할 데이터가 없습니다."
             )
-        except HTTPException:
-            raise
-        except Exception as e:
+
+        # 모델 수정 + 방문 기록(PENDING 상태의 cameratest) 추가 (단일 CTE 쿼리)
+        updated = await self.repository.update_model_with_camera_test(update_data.id, data_dict)
+        if not updated:
             raise HTTPException(
-                status_code=500,
-                detail=f"해외 모델 정보 수정 중 오류가 발생했습니다: {str(e)}"
+                status_code=404,
+                detail="등록된 모델이 존재하지 않습니다."
             )
 
+        # 커밋 후 모델 데이터 캐시 무효화
+        self.bump_data_version()
+
+        # 서버에서 만든 값이므로 검증 없이 생성
+        name = data_dict.get('name') or '모델'
+        return ModelResponse.model_construct(name=name, message=_UPDATE_MESSAGE % name)
+
 
 models_services = ModelsServices(models_repository)
\ No newline at end of file
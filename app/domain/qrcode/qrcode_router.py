@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response
 
 from app.domain.qrcode.qrcode_service import qrcode_service
 from app.domain.qrcode.qrcode_schemas import (
@@ -14,7 +14,7 @@ app = APIRouter(
 )
 
 
-@app.post("/generate", response_class=StreamingResponse)
+@app.post("/generate", response_class=Response)
 async def generate_qrcode_image(request: QRCodeGenerateRequest):
     """
     QR 코드 이미지 생성 (PNG)
@@ -35,10 +35,11 @@ async def generate_qrcode_image(request: QRCodeGenerateRequest):
       --output qrcode.png
     ```
     """
-    img_io, url = qrcode_service.generate_qrcode_image(request)
+    png, url = await qrcode_service.generate_qrcode_image(request)
     
-    return StreamingResponse(
-        img_io,
+    # 완성된 PNG 바이트를 한 번에 전송 (BytesIO를 스트리밍하면 줄바꿈 바이트 단위로 잘게 나뉘어 전송됨)
+    return Response(
+        png,
         media_type="image/png",
         headers={
             "Content-Disposition": f'attachment; filename="qrcode_{url[:30]}.png"'
@@ -72,7 +73,7 @@ async def generate_qrcode_base64(request: QRCodeGenerateRequest):
     <img src="data:image/png;base64,{qrcode_base64}" alt="QR Code">
     ```
     """
-    return qrcode_service.generate_qrcode_base64(request)
+    return await qrcode_service.generate_qrcode_base64(request)
 
 
 @app.get("/test")
@@ -88,10 +89,10 @@ async def test_qrcode():
         border=2
     )
     
-    img_io, url = qrcode_service.generate_qrcode_image(request)
+    png, url = await qrcode_service.generate_qrcode_image(request)
     
-    return StreamingResponse(
-        img_io,
+    return Response(
+        png,
         media_type="image/png",
         headers={
             "Content-Disposition": 'attachment; filename="test_qrcode.png"'
@@ -1,21 +1,53 @@
 import base64
+from functools import lru_cache
 from io import BytesIO
 from typing import Tuple
 
-import qrcode
-from qrcode.image.pil import PilImage
-from fastapi import HTTPException
+import anyio.to_thread
+import segno
 
 from app.domain.qrcode.qrcode_schemas import QRCodeGenerateRequest, QRCodeBase64Response
 
 
+# 기본 크기/테두리 (대부분의 요청이 이 값을 사용하므로 이 조합만 결과를 캐시)
+_DEFAULT_SIZE = QRCodeGenerateRequest.model_fields["size"].default
+_DEFAULT_BORDER = QRCodeGenerateRequest.model_fields["border"].default
+
+
+def _render_png(url: str, size: int, border: int) -> bytes:
+    """QR 코드 PNG 바이트 생성"""
+    # QR 코드 생성 (오류 수정 레벨 최고, 버전은 데이터 길이에 맞춰 자동 선택)
+    qr = segno.make_qr(url, error='h')
+
+    # 1비트 팔레트 PNG 바이트로 저장 (PIL 변환 없이 모듈 행렬에서 바로 인코딩)
+    img_io = BytesIO()
+    qr.save(img_io, kind='png', scale=size, border=border)
+    return img_io.getvalue()
+
+
+@lru_cache(maxsize=64)
+def _render_default_png(url: str) -> bytes:
+    """
+    기본 크기/테두리 QR 코드 PNG (같은 URL이면 항상 같은 이미지이므로 결과를 캐시)
+    - 크기/테두리를 키에 넣으면 큰 이미지로 캐시를 채울 수 있으므로 기본 조합만 캐시
+    """
+    return _render_png(url, _DEFAULT_SIZE, _DEFAULT_BORDER)
+
+
+def _render(url: str, size: int, border: int) -> bytes:
+    """QR 코드 PNG 바이트 (기본 크기/테두리면 캐시 사용)"""
+    if size == _DEFAULT_SIZE and border == _DEFAULT_BORDER:
+        return _render_default_png(url)
+    return _render_png(url, size, border)
+
+
 class QRCodeService:
     """QR 코드 생성 서비스"""
 
-    def generate_qrcode_image(
+    async def generate_qrcode_image(
         self,
         request: QRCodeGenerateRequest
-    ) -> Tuple[BytesIO, str]:
+    ) -> Tuple[bytes, str]:
         """
         QR 코드 이미지 생성 (PNG)
         
@@ -23,41 +55,13 @@ class QRCodeService:
             request: QR 코드 생성 요청
             
         Returns:
-            Tuple[BytesIO, str]: (이미지 바이트 스트림, URL)
-            
-        Raises:
-            HTTPException: QR 코드 생성 실패
+            Tuple[bytes, str]: (PNG 바이트, URL)
         """
-        try:
-            # QR 코드 생성기 설정
-            qr = qrcode.QRCode(
-                version=1,  # QR 코드 크기 (1-40, None이면 자동)
-                error_correction=qrcode.constants.ERROR_CORRECT_H,  # 오류 수정 레벨 (최고)
-                box_size=request.size,  # 각 박스의 픽셀 크기
-                border=request.border,  # 테두리 크기
-            )
-
-            # 데이터 추가 및 생성
-            qr.add_data(request.url)
-            qr.make(fit=True)
-
-            # PIL 이미지로 생성
-            img = qr.make_image(fill_color="black", back_color="white")
-
-            # BytesIO에 저장
-            img_io = BytesIO()
-            img.save(img_io, format='PNG')
-            img_io.seek(0)
-
-            return img_io, request.url
-
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"QR 코드 생성 중 오류가 발생했습니다: {str(e)}"
-            )
-
-    def generate_qrcode_base64(
+        # 렌더링은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        png = await anyio.to_thread.run_sync(_render, request.url, request.size, request.border)
+        return png, request.url
+
+    async def generate_qrcode_base64(
         self,
         request: QRCodeGenerateRequest
     ) -> QRCodeBase64Response:
@@ -69,31 +73,19 @@ class QRCodeService:
             
         Returns:
             QRCodeBase64Response: Base64 인코딩된 QR 코드
-            
-        Raises:
-            HTTPException: QR 코드 생성 실패
         """
-        try:
-            # QR 코드 이미지 생성
-            img_io, url = self.generate_qrcode_image(request)
-
-            # Base64로 인코딩
-            img_base64 = base64.b64encode(img_io.getvalue()).decode('utf-8')
-
-            return QRCodeBase64Response(
-                qrcode_base64=img_base64,
-                url=url,
-                size=request.size,
-                format="PNG"
-            )
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"QR 코드 Base64 변환 중 오류가 발생했습니다: {str(e)}"
-            )
+        # QR 코드 이미지 생성 (스트림을 거치지 않고 PNG 바이트를 바로 인코딩, 렌더링은 스레드에서 실행)
+        png = await anyio.to_thread.run_sync(_render, request.url, request.size, request.border)
+
+        # Base64로 인코딩
+        img_base64 = base64.b64encode(png).decode('utf-8')
+
+        return QRCodeBase64Response(
+            qrcode_base64=img_base64,
+            url=request.url,
+            size=request.size,
+            format="PNG"
+        )
 
 
 qrcode_service = QRCodeService()
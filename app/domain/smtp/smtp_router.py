@@ -2,7 +2,7 @@
 SMTP 관련 라우터
 - 임시 비밀번호 발송
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, BackgroundTasks
 
 from app.domain.smtp.smtp_service import smtp_service
 from app.domain.smtp.smtp_schemas import TempPasswordRequest, TempPasswordResponse
@@ -16,12 +16,12 @@ app = APIRouter(
 
 
 @app.post("/tempPassword", response_model=TempPasswordResponse)
-async def send_temp_password(request: TempPasswordRequest):
+async def send_temp_password(request: TempPasswordRequest, background_tasks: BackgroundTasks):
     """
     임시 비밀번호 발송
     
     - 입력된 이메일(pid)로 계정을 찾음
     - 임시 비밀번호를 생성하여 DB에 저장
-    - 생성된 임시 비밀번호를 이메일로 전송
+    - 생성된 임시 비밀번호를 이메일로 전송 (응답 후 백그라운드 발송)
     """
-    return await smtp_service.send_temp_password(request)
\ No newline at end of file
+    return await smtp_service.send_temp_password(request, background_tasks)
\ No newline at end of file
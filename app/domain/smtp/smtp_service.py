@@ -2,60 +2,38 @@
 SMTP 서비스
 - 임시 비밀번호 생성 및 발송
 """
-import random
+import asyncio
+import logging
+import secrets
 import string
-import smtplib
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from fastapi import HTTPException
+import aiosmtplib
+import anyio.to_thread
+from fastapi import BackgroundTasks, HTTPException
 
 from app.core.db import db
 from app.core.config import settings
-from app.shared import password_hasher
+from app.shared import password_hasher, TTLCache
 from app.domain.accounts.account_repository import AccountRepository
 from app.domain.smtp.smtp_schemas import TempPasswordRequest, TempPasswordResponse
 
 
-class SMTPService:
-    def __init__(self):
-        self.account_repository = AccountRepository()
+logger = logging.getLogger(__name__)
 
-    def _generate_temp_password(self) -> str:
-        """
-        임시 비밀번호 생성
-        - 12자리
-        - 영어 대문자, 소문자, 숫자, 특수문자 각 최소 1개 포함
-        """
-        # 각 카테고리에서 최소 1개씩 선택
-        password_chars = [
-            random.choice(string.ascii_uppercase),  # 대문자 1개
-            random.choice(string.ascii_lowercase),  # 소문자 1개
-            random.choice(string.digits),  # 숫자 1개
-            random.choice("!@#$%^&*()"),  # 특수문자 1개
-        ]
-        
-        # 나머지 8자리는 모든 문자에서 랜덤 선택
-        all_chars = string.ascii_uppercase + string.ascii_lowercase + string.digits + "!@#$%^&*()"
-        password_chars.extend(random.choices(all_chars, k=8))
-        
-        # 섞기
-        random.shuffle(password_chars)
-        
-        return ''.join(password_chars)
+# 임시 비밀번호 난수 생성기 (예측 불가능해야 하므로 OS 난수 사용)
+_random = secrets.SystemRandom()
+_SPECIAL_CHARS = "!@#$%^&*()"
+_PASSWORD_CHARS = string.ascii_uppercase + string.ascii_lowercase + string.digits + _SPECIAL_CHARS
 
-    async def _send_email(self, to_email: str, temp_password: str) -> None:
-        """
-        SMTP를 통해 임시 비밀번호 이메일 발송
-        """
-        try:
-            # 이메일 내용 작성
-            message = MIMEMultipart("alternative")
-            message["Subject"] = f"[{settings.APP_NAME}] 임시 비밀번호 발급"
-            message["From"] = settings.SMTP_FROM_EMAIL
-            message["To"] = to_email
+# 임시 비밀번호 이메일 제목/본문 템플릿 (발송마다 다시 만들지 않고 임시 비밀번호만 채움)
+_SUBJECT = f"[{settings.APP_NAME}] 임시 비밀번호 발급"
 
-            # HTML 이메일 본문
-            html_content = f"""
+# HTML 이메일 본문
+_HTML_TEMPLATE = """
             <html>
                 <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
                     <div style="max-width: 600px; margin: 0 auto; padding: 20px; border: 1px solid #ddd; border-radius: 10px;">
@@ -77,88 +55,184 @@ class SMTPService:
             </html>
             """
 
-            # Plain text 버전 (HTML 지원 안 되는 클라이언트용)
-            text_content = f"""
-            [{settings.APP_NAME}] 임시 비밀번호 발급
+# Plain text 버전 (HTML 지원 안 되는 클라이언트용, 앱 이름은 import 시 한 번만 채움)
+_TEXT_TEMPLATE = """
+            [{app_name}] 임시 비밀번호 발급
 
             안녕하세요,
             요청하신 임시 비밀번호가 발급되었습니다.
 
-            임시 비밀번호: {temp_password}
+            임시 비밀번호: {{temp_password}}
 
             ⚠️ 보안을 위해 로그인 후 반드시 비밀번호를 변경해주세요.
 
             본 메일은 발신 전용입니다.
-            """
+            """.format(app_name=settings.APP_NAME)
+
+# SMTP 연결 재사용 설정 (매 발송마다 TCP + TLS + 로그인 과정을 반복하지 않음)
+_SMTP_POOL_SIZE = settings.SMTP_MAX_CONCURRENCY  # 보관할 유휴 연결 수 (동시 발송 수만큼)
+_SMTP_MAX_MESSAGES = 100  # 연결당 최대 발송 수 (넘으면 새 연결로 교체)
+_SMTP_MAX_IDLE_SECONDS = 100  # 이보다 오래 쉰 연결은 서버가 끊었을 수 있으므로 폐기
+
+
+class SMTPService:
+    def __init__(self):
+        self.account_repository = AccountRepository()
+        # 계정이 있는 것으로 확인된 이메일(pid), 같은 이메일로 반복되는 재발급 요청의 DB 조회 흡수용 (10초)
+        # 없는 계정은 캐시하지 않음 (그 사이 가입한 계정이 바로 재발급받을 수 있도록)
+        self.account_exists_cache = TTLCache(ttl=10, maxsize=1024)
+        # 유휴 연결 목록: (연결, 마지막 사용 시각, 발송 수)
+        self._idle_connections: list[tuple[aiosmtplib.SMTP, float, int]] = []
+        # 동시 발송 수 제한 (몰린 요청이 메일 서버 속도 제한(421)에 걸려 연결/로그인 비용을 버리지 않도록)
+        self._send_semaphore = asyncio.Semaphore(settings.SMTP_MAX_CONCURRENCY)
+
+    async def _open_connection(self) -> aiosmtplib.SMTP:
+        """SMTP 서버 연결 + TLS + 로그인"""
+        smtp = aiosmtplib.SMTP(
+            hostname=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            start_tls=True,  # TLS 암호화
+        )
+        await smtp.connect()
+        await smtp.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
+        return smtp
+
+    @asynccontextmanager
+    async def _acquire(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        """
+        SMTP 연결 대여
+        - 유휴 연결이 있으면 NOOP으로 살아있는지 확인 후 재사용, 없으면 새로 연결
+        - 발송 중 오류가 난 연결은 반납하지 않고 닫음
+        """
+        smtp, sent = None, 0
+        while self._idle_connections:
+            candidate, last_used, candidate_sent = self._idle_connections.pop()
+            if time.monotonic() - last_used < _SMTP_MAX_IDLE_SECONDS:
+                try:
+                    await candidate.noop()
+                    smtp, sent = candidate, candidate_sent
+                    break
+                except (aiosmtplib.SMTPException, OSError):
+                    pass
+            candidate.close()
+        if smtp is None:
+            smtp = await self._open_connection()
+
+        try:
+            yield smtp
+        except BaseException:
+            smtp.close()
+            raise
+
+        sent += 1
+        if sent < _SMTP_MAX_MESSAGES and len(self._idle_connections) < _SMTP_POOL_SIZE:
+            self._idle_connections.append((smtp, time.monotonic(), sent))
+        else:
+            await self._quit(smtp)
+
+    async def _quit(self, smtp: aiosmtplib.SMTP) -> None:
+        """SMTP 연결 종료 (QUIT 실패 시 소켓만 닫음)"""
+        try:
+            await smtp.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            smtp.close()
+
+    async def close(self) -> None:
+        """보관 중인 SMTP 연결 모두 종료 (애플리케이션 종료 시 호출)"""
+        while self._idle_connections:
+            smtp, _, _ = self._idle_connections.pop()
+            await self._quit(smtp)
+
+    def _generate_temp_password(self) -> str:
+        """
+        임시 비밀번호 생성
+        - 12자리
+        - 영어 대문자, 소문자, 숫자, 특수문자 각 최소 1개 포함
+        """
+        # 각 카테고리에서 최소 1개씩 선택
+        password_chars = [
+            _random.choice(string.ascii_uppercase),  # 대문자 1개
+            _random.choice(string.ascii_lowercase),  # 소문자 1개
+            _random.choice(string.digits),  # 숫자 1개
+            _random.choice(_SPECIAL_CHARS),  # 특수문자 1개
+        ]
+        
+        # 나머지 8자리는 모든 문자에서 랜덤 선택
+        password_chars.extend(_random.choices(_PASSWORD_CHARS, k=8))
+        
+        # 섞기
+        _random.shuffle(password_chars)
+        
+        return ''.join(password_chars)
+
+    async def _send_email(self, to_email: str, temp_password: str) -> None:
+        """
+        SMTP를 통해 임시 비밀번호 이메일 발송
+        - 응답 전송 후 BackgroundTasks에서 실행되므로 실패를 HTTP 응답으로 돌려줄 수 없음
+          (예외를 올리지 않고 서버 로그에 남김, 사용자는 임시 비밀번호를 다시 요청하면 됨)
+        """
+        try:
+            # 이메일 내용 작성 (본문은 모듈 상수 템플릿에 임시 비밀번호만 채움)
+            message = MIMEMultipart("alternative")
+            message["Subject"] = _SUBJECT
+            message["From"] = settings.SMTP_FROM_EMAIL
+            message["To"] = to_email
 
             # 텍스트와 HTML 파트 추가
-            part1 = MIMEText(text_content, "plain")
-            part2 = MIMEText(html_content, "html")
-            message.attach(part1)
-            message.attach(part2)
-
-            # SMTP 서버 연결 및 전송
-            with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-                server.starttls()  # TLS 암호화
-                server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
-                server.send_message(message)
-
-        except smtplib.SMTPException as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"이메일 발송 중 오류가 발생했습니다: {str(e)}"
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"이메일 발송 중 예기치 않은 오류가 발생했습니다: {str(e)}"
-            )
+            message.attach(MIMEText(_TEXT_TEMPLATE.format(temp_password=temp_password), "plain"))
+            message.attach(MIMEText(_HTML_TEMPLATE.format(temp_password=temp_password), "html"))
+
+            # 재사용 SMTP 연결로 전송 (비동기 소켓이므로 발송 대기 중에도 이벤트 루프가 다른 요청 처리)
+            async with self._send_semaphore, self._acquire() as smtp:
+                await smtp.send_message(message)
+
+        except (aiosmtplib.SMTPException, OSError):
+            logger.exception("임시 비밀번호 이메일 발송 실패: %s", to_email)
 
-    async def send_temp_password(self, request: TempPasswordRequest) -> TempPasswordResponse:
+    async def send_temp_password(
+        self,
+        request: TempPasswordRequest,
+        background_tasks: BackgroundTasks
+    ) -> TempPasswordResponse:
         """
         임시 비밀번호 생성 및 발송
         1. 계정 존재 확인
         2. 임시 비밀번호 생성
         3. DB에 해시화하여 저장
-        4. 이메일 발송
+        4. 이메일 발송 (응답 전송 후 백그라운드에서 실행)
         """
-        try:
-            # 1. 계정 존재 확인
-            user = await self.account_repository.get_by_pid(request.pid)
-            if not user:
-                raise HTTPException(
-                    status_code=404,
-                    detail="해당 이메일로 등록된 계정을 찾을 수 없습니다."
-                )
-
-            # 2. 임시 비밀번호 생성
-            temp_password = self._generate_temp_password()
-
-            # 3. 비밀번호 해시화 및 DB 저장
-            hashed_password = password_hasher.hash_password(temp_password)
-            async with db.transaction() as conn:
-                await self.account_repository.update_password_transaction(
-                    conn=conn,
-                    pid=request.pid,
-                    new_password=hashed_password
-                )
-
-            # 4. 이메일 발송
-            await self._send_email(request.pid, temp_password)
-
-            return TempPasswordResponse(
-                message="임시 비밀번호가 이메일로 발송되었습니다. 로그인 후 비밀번호를 변경해주세요.",
-                email=request.pid
+        # 1. 계정 존재 확인 (존재하는 경우만 짧게 캐시, 비밀번호 변경과 무관)
+        exists = self.account_exists_cache.get(request.pid)
+        if exists is None:
+            exists = await self.account_repository.check_pid_exists(request.pid)
+            if exists:
+                self.account_exists_cache.set(request.pid, True)
+        if not exists:
+            raise HTTPException(
+                status_code=404,
+                detail="해당 이메일로 등록된 계정을 찾을 수 없습니다."
             )
 
-        except HTTPException:
-            raise
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"임시 비밀번호 발급 중 오류가 발생했습니다: {str(e)}"
+        # 2. 임시 비밀번호 생성
+        temp_password = self._generate_temp_password()
+
+        # 3. 비밀번호 해시화 및 DB 저장 (bcrypt는 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행)
+        hashed_password = await anyio.to_thread.run_sync(password_hasher.hash_password, temp_password)
+        async with db.transaction() as conn:
+            await self.account_repository.update_password_transaction(
+                conn=conn,
+                pid=request.pid,
+                new_password=hashed_password
             )
 
+        # 4. 이메일 발송 (SMTP 왕복을 기다리지 않고 응답, 발송 실패는 서버 로그에 남음)
+        background_tasks.add_task(self._send_email, request.pid, temp_password)
+
+        return TempPasswordResponse(
+            message="임시 비밀번호가 이메일로 발송되었습니다. 로그인 후 비밀번호를 변경해주세요.",
+            email=request.pid
+        )
+
 
 # Singleton 인스턴스
 smtp_service = SMTPService()
@@ -9,6 +9,7 @@ from .validators import (
     serialize_phone_optional,
     ValidatedPhoneNumber,
     ValidatedPhoneNumberOptional,
+    UUID_PATTERN,
 )
 from .security import (
     password_hasher,
@@ -16,6 +17,7 @@ from .security import (
     PasswordHasher,
     JWTHandler,
 )
+from .cache import TTLCache
 from .dependencies import (
     get_current_user,
     require_admin,
@@ -29,6 +31,7 @@ __all__ = [
     "serialize_phone_optional",
     "ValidatedPhoneNumber",
     "ValidatedPhoneNumberOptional",
+    "UUID_PATTERN",
     "password_hasher",
     "jwt_handler",
     "PasswordHasher",
@@ -36,4 +39,5 @@ __all__ = [
     "get_current_user",
     "require_admin",
     "require_admin_or_director",
+    "TTLCache",
 ]
\ No newline at end of file
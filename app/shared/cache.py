@@ -0,0 +1,49 @@
+"""
+인메모리 TTL 캐시
+- 짧은 시간 동안 동일한 조회 결과를 재사용 (워커 프로세스 단위)
+"""
+import time
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """만료 시간이 있는 간단한 인메모리 캐시"""
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        """
+        TTLCache 초기화
+
+        Args:
+            ttl: 항목 유효 시간 (초)
+            maxsize: 최대 저장 항목 수 (초과 시 가장 먼저 저장된 항목 제거)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._store: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """캐시 조회 (없거나 만료되었으면 default 반환)"""
+        entry = self._store.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._store.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """캐시 저장"""
+        if key not in self._store and len(self._store) >= self.maxsize:
+            # dict는 삽입 순서를 유지하므로 첫 번째 키가 가장 오래된 항목
+            self._store.pop(next(iter(self._store)), None)
+        self._store[key] = (time.monotonic() + self.ttl, value)
+
+    def delete(self, key: Hashable) -> None:
+        """항목 삭제 (없으면 무시)"""
+        self._store.pop(key, None)
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        self._store.clear()
@@ -3,12 +3,14 @@ FastAPI Dependencies
 - JWT 인증 미들웨어
 - 권한 확인
 """
+import time
+from uuid import UUID
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer
 from fastapi.security.http import HTTPAuthorizationCredentials
 
-from app.shared import jwt_handler
+from app.shared import jwt_handler, TTLCache
 from app.domain.accounts.account_repository import AccountRepository
 from app.domain.accounts.account_schemas import UserRole
 
@@ -17,6 +19,18 @@ from app.domain.accounts.account_schemas import UserRole
 security = HTTPBearer()
 account_repository = AccountRepository()
 
+# 액세스 토큰 -> (토큰 만료 시각, 사용자 정보)
+# 같은 토큰으로 연달아 들어오는 요청은 JWT 검증과 사용자 조회를 건너뜀
+# 토큰 만료 시각 이후에는 캐시를 쓰지 않고, 계정 삭제 시 invalidate_current_user로 바로 제거
+# (워커 프로세스 단위 캐시이므로 다른 워커에서는 권한 변경이 최대 30초 늦게 반영될 수 있음)
+_current_user_cache = TTLCache(ttl=30, maxsize=10_000)
+# 계정 ID -> 캐시된 액세스 토큰 목록 (계정 삭제 시 해당 계정의 캐시 항목만 제거하기 위한 색인)
+_cached_tokens_by_account = TTLCache(ttl=30, maxsize=10_000)
+
+# 권한 확인용 역할 값 (DB에서 읽은 role 문자열과 바로 비교, 요청마다 목록을 만들지 않음)
+_ADMIN_ROLE = UserRole.ADMIN.value
+_ADMIN_OR_DIRECTOR_ROLES = frozenset((UserRole.ADMIN.value, UserRole.DIRECTOR.value))
+
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
     """
@@ -25,6 +39,10 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     - 유효하지 않은 토큰이면 401 에러
     """
     token = credentials.credentials
+    cached = _current_user_cache.get(token)
+    if cached is not None and cached[0] > time.time():
+        return cached[1]
+
     payload = jwt_handler.verify_token(token, token_type="access")
     
     if not payload:
@@ -43,12 +61,31 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    return {
+    current_user = {
         "id": user["id"],
         "pid": user["pid"],
         "name": user["name"],
         "role": user["role"],
     }
+    _current_user_cache.set(token, (payload["exp"], current_user))
+    tokens = _cached_tokens_by_account.get(current_user["id"]) or set()
+    tokens.add(token)
+    _cached_tokens_by_account.set(current_user["id"], tokens)
+    return current_user
+
+
+def invalidate_current_user(account_id: UUID) -> None:
+    """
+    계정의 캐시된 사용자 정보 제거 (계정 삭제 직후 호출, 다음 요청부터 DB에서 다시 확인)
+    - 색인이 없으면(용량 초과로 밀려난 경우 등) 남은 항목을 찾을 수 없으므로 캐시 전체 삭제
+    """
+    tokens = _cached_tokens_by_account.get(account_id)
+    if tokens is None:
+        _current_user_cache.clear()
+        return
+    for token in tokens:
+        _current_user_cache.delete(token)
+    _cached_tokens_by_account.delete(account_id)
 
 
 async def require_admin(current_user: dict = Depends(get_current_user)) -> dict:
@@ -56,7 +93,7 @@ async def require_admin(current_user: dict = Depends(get_current_user)) -> dict:
     관리자 권한 확인
     - ADMIN 역할만 허용
     """
-    if current_user["role"] != UserRole.ADMIN.value:
+    if current_user["role"] != _ADMIN_ROLE:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="관리자 권한이 필요합니다.",
@@ -69,7 +106,7 @@ async def require_admin_or_director(current_user: dict = Depends(get_current_use
     관리자 또는 디렉터 권한 확인
     - ADMIN 또는 DIRECTOR 역할 허용
     """
-    if current_user["role"] not in [UserRole.ADMIN.value, UserRole.DIRECTOR.value]:
+    if current_user["role"] not in _ADMIN_OR_DIRECTOR_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="관리자 또는 디렉터 권한이 필요합니다.",
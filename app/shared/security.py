@@ -3,12 +3,15 @@
 - 비밀번호 해싱 (bcrypt)
 - JWT 토큰 생성/검증
 """
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 from typing import Optional
 from app.core.config import settings
 import bcrypt
 import jwt
+import orjson
 from jwt.exceptions import InvalidTokenError
+from jwt.utils import base64url_encode
 
 
 # JWT 설정 (실제 환경에서는 환경변수로 관리)
@@ -17,6 +20,27 @@ ALGORITHM = settings.ALGORITHM;
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES;
 REFRESH_TOKEN_EXPIRE_DAYS = settings.REFRESH_TOKEN_EXPIRE_DAYS;
 
+# bcrypt cost (배포 환경 코어 성능에 맞춰 환경변수로 고정, 기존 해시는 해시에 기록된 cost로 검증)
+BCRYPT_ROUNDS = settings.BCRYPT_ROUNDS
+
+# 토큰 기본 만료 기간(초) / 허용 알고리즘 목록 (토큰마다 다시 만들지 않음)
+_ACCESS_TOKEN_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TOKEN_EXPIRE_SECONDS = REFRESH_TOKEN_EXPIRE_DAYS * 86400
+_ALGORITHMS = [ALGORITHM]
+
+# 서명 알고리즘/키/헤더 세그먼트 (프로세스 동안 바뀌지 않으므로 import 시 한 번만 준비)
+# jwt.encode는 토큰마다 알고리즘 조회, 키 준비, 헤더 JSON 직렬화를 반복함
+_SIGNING_ALGORITHM = jwt.get_algorithm_by_name(ALGORITHM)
+_SIGNING_KEY = _SIGNING_ALGORITHM.prepare_key(SECRET_KEY)
+_HEADER_SEGMENT = base64url_encode(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"}))
+
+
+def _encode_token(claims: dict) -> str:
+    """JWT 서명 (jwt.encode와 같은 형식, jwt.decode로 그대로 검증 가능)"""
+    signing_input = _HEADER_SEGMENT + b"." + base64url_encode(orjson.dumps(claims))
+    signature = _SIGNING_ALGORITHM.sign(signing_input, _SIGNING_KEY)
+    return (signing_input + b"." + base64url_encode(signature)).decode()
+
 
 class PasswordHasher:
     """비밀번호 해싱/검증 클래스"""
@@ -32,8 +56,8 @@ class PasswordHasher:
         Returns:
             str: 해싱된 비밀번호 (UTF-8 문자열)
         """
-        # bcrypt로 해싱 (자동으로 salt 생성)
-        salt = bcrypt.gensalt()
+        # bcrypt로 해싱 (자동으로 salt 생성, cost는 설정값 사용)
+        salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
         return hashed.decode('utf-8')
 
@@ -73,19 +97,15 @@ class JWTHandler:
         Returns:
             str: JWT 액세스 토큰
         """
-        to_encode = data.copy()
-        
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-        
-        to_encode.update({
+        # exp는 epoch 정수로 바로 계산 (datetime 생성/변환 없이 JWT 클레임 형식 그대로)
+        expire = int(time.time()) + (int(expires_delta.total_seconds()) if expires_delta else _ACCESS_TOKEN_EXPIRE_SECONDS)
+        to_encode = {
+            **data,
             "exp": expire,
-            "type": "access"  # 토큰 타입 명시
-        })
-        
-        encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+            "type": "access",  # 토큰 타입 명시
+        }
+
+        encoded_jwt = _encode_token(to_encode)
         return encoded_jwt
 
     @staticmethod
@@ -103,19 +123,14 @@ class JWTHandler:
         Returns:
             str: JWT 리프레시 토큰
         """
-        to_encode = data.copy()
-        
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-        
-        to_encode.update({
+        expire = int(time.time()) + (int(expires_delta.total_seconds()) if expires_delta else _REFRESH_TOKEN_EXPIRE_SECONDS)
+        to_encode = {
+            **data,
             "exp": expire,
-            "type": "refresh"  # 토큰 타입 명시
-        })
-        
-        encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+            "type": "refresh",  # 토큰 타입 명시
+        }
+
+        encoded_jwt = _encode_token(to_encode)
         return encoded_jwt
 
     @staticmethod
@@ -131,7 +146,7 @@ class JWTHandler:
             dict: 토큰 payload (검증 실패 시 None)
         """
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            payload = jwt.decode(token, SECRET_KEY, algorithms=_ALGORITHMS)
             
             # 토큰 타입 검증
             if payload.get("type") != token_type:
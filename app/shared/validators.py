@@ -1,3 +1,5 @@
+import re
+from functools import lru_cache
 from typing import Literal, Annotated, Any
 from phonenumbers import is_valid_number, parse, NumberParseException, PhoneNumberFormat, format_number
 from phonenumbers.phonenumber import PhoneNumber
@@ -6,6 +8,25 @@ from pydantic import BeforeValidator, PlainSerializer, WithJsonSchema
 # Literal 타입을 사용하여 허용되는 포맷을 명시
 PhoneFormat = Literal["E164", "INTERNATIONAL", "NATIONAL"]
 
+_PHONE_FORMATS = {
+    "E164": PhoneNumberFormat.E164,
+    "INTERNATIONAL": PhoneNumberFormat.INTERNATIONAL,
+    "NATIONAL": PhoneNumberFormat.NATIONAL,
+}
+
+# 한국 휴대폰 번호 형식 (국내 010xxxxxxxx / E.164 +8210xxxxxxxx)
+# parse()의 문자열 정규화/국가 코드 추출 없이 PhoneNumber를 바로 만들고 유효성만 검사 (결과는 parse()와 동일)
+_KR_MOBILE_NATIONAL = re.compile(r"01[0-9]{8,9}")
+_KR_MOBILE_E164 = re.compile(r"\+821[0-9]{8,9}")
+
+_INVALID_PHONE_MESSAGE = (
+    '유효하지 않은 전화번호 형식입니다. '
+    'E.164 형식(예: +821012345678) 또는 한국 번호(예: 01012345678)로 입력해주세요.'
+)
+
+# UUID 문자열 형식 (uuid.UUID 객체로 변환하지 않고 문자열 그대로 검증 후 DB에 전달)
+UUID_PATTERN = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+
 
 def validate_phone(v: str | PhoneNumber) -> PhoneNumber:
     """
@@ -36,6 +57,29 @@ def validate_phone(v: str | PhoneNumber) -> PhoneNumber:
         # 비어있다면 ValueError 발생
         raise ValueError('전화번호는 비어있지 않은 문자열이어야 합니다.')
 
+    return _parse_phone(v)
+
+
+@lru_cache(maxsize=4096)
+def _parse_phone(v: str) -> PhoneNumber:
+    """
+    전화번호 문자열 파싱/검증 (같은 문자열은 캐시된 결과 재사용)
+    - 재방문 확인처럼 같은 번호가 반복 입력될 때 phonenumbers.parse를 다시 하지 않음
+    - 반환된 PhoneNumber 객체는 공유되므로 수정하지 않는다
+    - 실패(ValueError)는 캐시되지 않음
+    """
+    # 한국 휴대폰 번호는 형식이 고정되어 있으므로 parse() 생략
+    if _KR_MOBILE_NATIONAL.fullmatch(v):
+        phone = PhoneNumber(country_code=82, national_number=int(v[1:]))  # 국내 접두사 0 제거
+        if is_valid_number(phone):
+            return phone
+        raise ValueError(_INVALID_PHONE_MESSAGE)
+    if _KR_MOBILE_E164.fullmatch(v):
+        phone = PhoneNumber(country_code=82, national_number=int(v[3:]))  # +82 제거
+        if is_valid_number(phone):
+            return phone
+        raise ValueError('유효하지 않은 국제 전화번호입니다.')
+
     # E.164 형식 시도 (+로 시작)
     if v.startswith('+'):
         try:
@@ -67,10 +111,11 @@ def validate_phone(v: str | PhoneNumber) -> PhoneNumber:
         pass  # 예외가 발생해도 최종 에러로 넘어감
 
     #한국 번호로 파싱 성공했지만 is_valid_number()가 False, 한국 번호로 파싱 자체가 실패 (너무 짧거나 이상한 형식)
-    raise ValueError(
-        '유효하지 않은 전화번호 형식입니다. '
-        'E.164 형식(예: +821012345678) 또는 한국 번호(예: 01012345678)로 입력해주세요.'
-    )
+    raise ValueError(_INVALID_PHONE_MESSAGE)
+
+
+# 한국 번호 메타데이터/정규식을 import 시점에 미리 로드 (첫 요청에서 지연 로딩 비용 제거)
+is_valid_number(parse("01012345678", "KR"))
 
 
 def validate_phone_optional(v: str | PhoneNumber | None) -> PhoneNumber | None:
@@ -86,7 +131,9 @@ def validate_phone_optional(v: str | PhoneNumber | None) -> PhoneNumber | None:
     Note:
         빈 문자열('')은 None으로 처리됩니다.
     """
-    if v is None or (isinstance(v, str) and not v):
+    # 값이 있는 일반적인 경우는 truthiness 검사 한 번으로 통과
+    # (0/False 같은 다른 falsy 값은 기존대로 validate_phone에서 오류)
+    if not v and (v is None or v == ""):
         return None
     return validate_phone(v)
 
@@ -105,13 +152,55 @@ def serialize_phone(phone: PhoneNumber, format_: PhoneFormat = "NATIONAL") -> st
     Returns:
         str: 포맷된 전화번호 문자열
     """
-    format_map = {
-        "E164": PhoneNumberFormat.E164,
-        "INTERNATIONAL": PhoneNumberFormat.INTERNATIONAL,
-        "NATIONAL": PhoneNumberFormat.NATIONAL,
-    }
-    phone_format = format_map[format_]  # Literal 타입이므로 항상 존재
-    return format_number(phone, phone_format)
+    # PhoneNumber 객체 대신 포맷 결과를 결정하는 값들만 키로 사용
+    return _format_phone(
+        phone.country_code,
+        phone.national_number,
+        phone.italian_leading_zero,
+        phone.number_of_leading_zeros,
+        phone.extension,
+        format_,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _format_phone(
+    country_code: int,
+    national_number: int,
+    italian_leading_zero: bool | None,
+    number_of_leading_zeros: int | None,
+    extension: str | None,
+    format_: PhoneFormat,
+) -> str:
+    """
+    전화번호 포맷 (같은 번호/형식은 캐시된 결과 재사용)
+    - 목록 응답/재방문 확인처럼 같은 번호가 반복 직렬화될 때 format_number를 다시 하지 않음
+    """
+    phone = PhoneNumber(
+        country_code=country_code,
+        national_number=national_number,
+        italian_leading_zero=italian_leading_zero,
+        number_of_leading_zeros=number_of_leading_zeros,
+        extension=extension,
+    )
+    return format_number(phone, _PHONE_FORMATS[format_])  # Literal 타입이므로 항상 존재
+
+
+def _serialize_e164(phone: PhoneNumber) -> str:
+    """응답 직렬화용 E.164 포맷 (형식 인자 전달/분기 없이 바로 캐시된 포맷 함수 호출)"""
+    return _format_phone(
+        phone.country_code,
+        phone.national_number,
+        phone.italian_leading_zero,
+        phone.number_of_leading_zeros,
+        phone.extension,
+        "E164",
+    )
+
+
+def _serialize_e164_optional(phone: PhoneNumber | None) -> str | None:
+    """응답 직렬화용 E.164 포맷 (None 허용)"""
+    return _serialize_e164(phone) if phone else None
 
 
 def serialize_phone_optional(
@@ -141,13 +230,14 @@ def serialize_phone_optional(
 ValidatedPhoneNumber = Annotated[
     Any,  # PhoneNumber 타입이 실제 런타임 타입이지만, Pydantic에게는 Any로 알림
     BeforeValidator(validate_phone),  # 입력값을 PhoneNumber로 변환
-    PlainSerializer(lambda p: serialize_phone(p, "E164")),  # JSON 직렬화 시 E164 형식 사용
+    # JSON 직렬화 시 E164 형식 사용 (Python dict 덤프에서는 PhoneNumber 그대로, DB 저장 시 서비스에서 직접 변환)
+    PlainSerializer(_serialize_e164, return_type=str, when_used="json"),
     WithJsonSchema({"type": "string", "example": "+821012345678"}),  # OpenAPI 문서용 스키마
 ]
 
 ValidatedPhoneNumberOptional = Annotated[
     Any,  # PhoneNumber | None 타입이 실제 런타임 타입이지만, Pydantic에게는 Any로 알림
     BeforeValidator(validate_phone_optional),  # 입력값을 PhoneNumber | None으로 변환
-    PlainSerializer(lambda p: serialize_phone_optional(p, "E164") if p else None),  # JSON 직렬화
+    PlainSerializer(_serialize_e164_optional, return_type=str | None, when_used="json"),  # JSON 직렬화 (E164 형식)
     WithJsonSchema({"type": "string", "example": "+821012345678", "nullable": True}),  # OpenAPI 문서용 스키마
 ]
\ No newline at end of file
@@ -1,7 +1,12 @@
+import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Body
+import asyncpg
+import orjson
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 
 from app.core.db import db
 from app.core.config import settings
@@ -9,10 +14,11 @@ from app.domain.accounts import account_router
 from app.domain.admins import admins_router
 from app.domain.excel import excel_router
 from app.domain.models import models_router
-from app.domain.models.models_schemas import ReadRevisitedModel
-from app.domain.models.models_services import models_services
 from app.domain.qrcode import qrcode_router
 from app.domain.smtp import smtp_router
+from app.domain.smtp.smtp_service import smtp_service
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
@@ -28,6 +34,7 @@ async def lifespan(app: FastAPI):
     yield  # 애플리케이션 실행
 
     # 종료 시 실행
+    await smtp_service.close()
     await db.disconnect()
     print("데이터베이스 연결 해제 완료")
 
@@ -35,15 +42,23 @@ app = FastAPI(
     title="모델 에이전시 API",
     version="1.0.0",
     description="모델 에이전시 백엔드 API",
+    default_response_class=ORJSONResponse,  # 응답 JSON 인코딩을 orjson으로 처리
     lifespan=lifespan)
 
+# 응답 압축 (목록/검색 JSON은 반복되는 키가 많아 크게 줄어듦, 1KB 미만 응답은 그대로 전송)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# CORS 허용 도메인 목록 (쉼표 구분 문자열을 import 시 한 번만 파싱, 공백/빈 항목 제거)
+_ALLOWED_ORIGINS = tuple(o.strip() for o in settings.ALLOWED_ORIGINS.split(",") if o.strip())
+
 # CORS 미들웨어 설정
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS.split(","),  # .env에서 설정한 허용 도메인 목록
+    allow_origins=_ALLOWED_ORIGINS,  # .env에서 설정한 허용 도메인 목록
     allow_credentials=True,  # 쿠키 등 인증 정보 포함 허용
     allow_methods=["*"],  # 모든 HTTP 메소드 허용 (GET, POST, PUT, DELETE 등)
     allow_headers=["*"],  # 모든 헤더 허용
+    expose_headers=["X-Next-Cursor"],  # 목록 페이지 커서 헤더를 브라우저에서 읽을 수 있도록 노출
 )
 
 app.include_router(models_router.app)
@@ -53,28 +68,61 @@ app.include_router(excel_router.app)
 app.include_router(account_router.app)
 app.include_router(qrcode_router.app)
 
+
+def _check_duplicate_routes(app: FastAPI) -> None:
+    """같은 method + path 라우트 중복 등록 확인 (먼저 등록된 라우트가 뒤의 라우트를 가림)"""
+    seen = set()
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or ():
+            key = (method, route.path)
+            if key in seen:
+                raise RuntimeError(f"중복 등록된 라우트가 있습니다: {method} {route.path}")
+            seen.add(key)
+
+
+# 전역 예외 핸들러 (서비스 메서드별 try/except 대신 한 곳에서 500 응답 처리)
+@app.exception_handler(asyncpg.PostgresError)
+async def postgres_exception_handler(request: Request, exc: asyncpg.PostgresError):
+    """데이터베이스 오류 처리 (상세 내용은 서버 로그에만 남기고 응답에는 노출하지 않음)"""
+    logger.exception("데이터베이스 오류: %s %s", request.method, request.url.path, exc_info=exc)
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "데이터베이스 오류가 발생했습니다."},
+    )
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """처리되지 않은 예외 처리 (스택 트레이스는 서버 로그에 그대로 남고, 응답에는 예외 내용을 노출하지 않음)"""
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "서버 내부 오류가 발생했습니다."},
+    )
+
+
+# 고정 응답 본문 (매 요청 직렬화하지 않고 import 시 한 번만 인코딩)
+_ROOT_BODY = orjson.dumps({
+    "message": "모델 에이전시 백엔드 API",
+    "version": "1.0.0",
+    "status": "실행중"
+})
+_HEALTH_BODY = orjson.dumps({"status": "ok"})
+
+
 @app.get("/")
 async def root():
     """루트 엔드포인트"""
-    try:
-        return {
-            "message": "모델 에이전시 백엔드 API",
-            "version": "1.0.0",
-            "status": "실행중"
-        }
-    except Exception as e:
-        return {
-            "message": "모델 에이전시 백엔드 API",
-            "version": "1.0.0",
-            "status": "종료 상태",
-            "error": e
-        }
+    return Response(_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health():
-    return {"status": "ok"}
+    return Response(_HEALTH_BODY, media_type="application/json")
+
+
+_check_duplicate_routes(app)
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # 코드 변경 감시(reload)는 개발 환경에서만 사용 (감시 프로세스/파일 폴링 비용)
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=settings.DEBUG)
\ No newline at end of file
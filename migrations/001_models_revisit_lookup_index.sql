@@ -0,0 +1,5 @@
+-- 재방문 확인 조회용 인덱스
+-- ModelsRepository.get_domestic_model_by_info / get_foreign_model_by_info
+--   WHERE name = $1 AND phone = $2 AND birth_date = $3 AND is_foreigner = ...
+CREATE INDEX IF NOT EXISTS idx_models_name_phone_birth_date
+    ON models (name, phone, birth_date);
@@ -0,0 +1,14 @@
+-- 카메라 테스트 중복 등록 방지 (모델당 하루 1건)
+-- AdminsRepository.create_camera_test 는 금일 등록 건이 없을 때만 INSERT 하지만,
+-- 동시에 들어온 요청은 서로의 INSERT를 보지 못하므로 유니크 인덱스로 최종 보장한다.
+-- INSERT 쪽은 ON CONFLICT DO NOTHING 이므로 인덱스 적용 전/후 모두 동작한다.
+--
+-- 주의
+-- - visited_at 이 timestamp (without time zone) 컬럼이어야 한다 (date 캐스팅이 IMMUTABLE 이어야 인덱스 생성 가능).
+-- - 기존 데이터에 같은 날 중복 행이 있으면 생성이 실패하므로 먼저 확인/정리한다:
+--     SELECT model_id, visited_at::date, COUNT(*)
+--     FROM cameratest
+--     GROUP BY model_id, visited_at::date
+--     HAVING COUNT(*) > 1;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_cameratest_model_id_visited_date
+    ON cameratest (model_id, (visited_at::date));
@@ -0,0 +1,18 @@
+-- 관리자 모델 검색용 인덱스
+-- AdminsRepository.search_models / count_models
+--   WHERE is_foreigner = $1 AND name ILIKE '%...%' ... ORDER BY created_at DESC
+
+-- 부분 일치(ILIKE '%...%') 검색을 인덱스로 처리하기 위한 trigram 인덱스
+-- 주의: 검색어가 3글자 미만이면 trigram을 만들 수 없어 인덱스를 사용하지 못함 (2글자 이름 등은 기존처럼 스캔)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_models_name_trgm
+    ON models USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_models_special_abilities_trgm
+    ON models USING gin (special_abilities gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_models_other_languages_trgm
+    ON models USING gin (other_languages gin_trgm_ops);
+
+-- 국내/해외 구분 + 최신순 정렬 (필터 없는 목록 조회는 인덱스 순서대로 LIMIT만큼 읽고 종료)
+CREATE INDEX IF NOT EXISTS idx_models_is_foreigner_created_at
+    ON models (is_foreigner, created_at DESC);
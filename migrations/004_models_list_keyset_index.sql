@@ -0,0 +1,10 @@
+-- 모델 목록 키셋 페이지네이션용 인덱스
+-- ModelsRepository.get_models_of_domestic_page / get_models_of_foreign_page
+--   WHERE is_foreigner = $1 AND (created_at, id) < ($4, $5) ORDER BY created_at DESC, id DESC LIMIT $2
+-- id까지 인덱스 순서에 포함해 같은 created_at 행도 정렬 없이 인덱스 순서대로 읽는다.
+CREATE INDEX IF NOT EXISTS idx_models_is_foreigner_created_at_id
+    ON models (is_foreigner, created_at DESC, id DESC);
+
+-- 003의 (is_foreigner, created_at DESC) 인덱스는 위 인덱스의 앞부분과 같으므로 제거
+-- (관리자 검색의 ORDER BY created_at DESC 도 위 인덱스로 처리)
+DROP INDEX IF EXISTS idx_models_is_foreigner_created_at;